@@ -0,0 +1,82 @@
+import asyncio
+import pipeline
+import scrape_data as scraper
+from concurrent.futures import ThreadPoolExecutor
+from deadline import Deadline
+from snapshots import SnapshotStore
+
+
+async def run(sport, parse_executor=None, deadline=None, fetch_executor=None):
+    """Asynchronous pipeline.run(): scrape a sport without blocking the loop.
+
+    The fetch stage runs on a thread through the shared http_client, so it
+    keeps connection pooling, proxies, the circuit breaker and rate limiting,
+    while other scrapes proceed on the event loop. The remaining stages run
+    on parse_executor.
+
+    Args:
+        sport (string): The name of the sport to scrape info for.
+        parse_executor (Executor): Runs the parse, weave and enrich stages.
+            Defaults to the event loop's default executor.
+        deadline (Deadline): When the scrape has to be finished by. Defaults
+            to pipeline.SCRAPE_DEADLINE seconds from now.
+        fetch_executor (Executor): Runs the fetch stage. Defaults to the
+            event loop's default executor.
+
+    Returns:
+        List: Dict holding information for each matchup.
+
+    Raises:
+        RequestException: If the page couldn't be fetched.
+        DeadlineExceeded: If the deadline passed before the scrape finished.
+    """
+    deadline = deadline or Deadline(pipeline.SCRAPE_DEADLINE)
+    loop = asyncio.get_running_loop()
+    with pipeline.track_deadline(sport, deadline):
+        http_response = await loop.run_in_executor(
+            fetch_executor, pipeline.run_fetch, sport, deadline)
+        return await loop.run_in_executor(
+            parse_executor, pipeline.run_processing, sport, http_response, deadline)
+
+
+async def scrape_data_for(sport, parse_executor=None, fetch_executor=None):
+    """Asynchronous pipeline.scrape_data_for(), with the same fallbacks.
+
+    Returns:
+        List: JSON object for each matchup.
+    """
+    snapshot_store = SnapshotStore()
+    try:
+        matchups = await run(sport, parse_executor, fetch_executor=fetch_executor)
+    except Exception:
+        # Proxy and HTTP errors as well as pages that failed to scrape.
+        return await asyncio.to_thread(pipeline.fallback_data_for, sport, snapshot_store)
+    await asyncio.to_thread(snapshot_store.save, sport, matchups)
+    return matchups
+
+
+async def scrape_sports(sports, parse_executor=None):
+    """Scrape several sports concurrently.
+
+    Each sport's fetch gets a thread of its own, rather than sharing the
+    event loop's default executor, which has as few as 5 threads on a
+    single-CPU host.
+
+    Returns:
+        Dict: Each sport's list of matchups, keyed by sport.
+    """
+    sports = list(sports)
+    with ThreadPoolExecutor(max_workers=max(len(sports), 1)) as fetch_executor:
+        results = await asyncio.gather(
+            *(scrape_data_for(sport, parse_executor, fetch_executor) for sport in sports))
+    return dict(zip(sports, results))
+
+
+def scrape_all(sports=scraper.SPORTS, parse_executor=None):
+    """Scrape every sport on one event loop, so the whole refresh takes about
+    as long as the slowest sport instead of the sum of all of them.
+
+    Returns:
+        Dict: Each sport's list of matchups, keyed by sport.
+    """
+    return asyncio.run(scrape_sports(sorted(sports), parse_executor))
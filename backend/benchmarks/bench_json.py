@@ -0,0 +1,65 @@
+import os
+import timeit
+import scrape_data as scraper
+
+# TO RUN, be at backend as current directory.  Run python -m benchmarks.bench_json
+# The pages are synthetic (see tests/make_pages.py), so the timings compare
+# the options with each other but aren't representative of the live site.
+
+PAGES_DIR = os.path.join(os.path.dirname(__file__), os.pardir, 'tests', 'pages')
+
+# The attributes a scrape decodes.
+DECODED_ATTRIBUTES = ('data-op-name', 'data-op-date', 'data-op-moneyline')
+
+
+def page_attributes(content):
+    """Every decoded attribute value on a test page, in page order."""
+    text = content.decode('utf-8')
+    return [value for _, attrs, _ in scraper.scan_elements(text)
+            for name, value in attrs.items() if name in DECODED_ATTRIBUTES]
+
+
+def decode_all(attributes, decode):
+    for attribute in attributes:
+        decode(attribute)
+
+
+def time_decoding(attributes, backend, mode, repeat):
+    """Best time to decode a page's attributes.
+
+    mode is "plain" (no memoization), "memo" (a fresh cache, as on the first
+    scrape of a page) or "warm" (a cache filled by the previous scrape, as on
+    a refresh where most of the page is unchanged).
+    """
+    def run():
+        decode_all(attributes, decode)
+
+    times = []
+    for _ in range(repeat):
+        decode = scraper.make_attribute_decoder(backend, 0 if mode == "plain" else 4096)
+        if mode == "warm":
+            decode_all(attributes, decode)
+        times.append(timeit.timeit(run, number=1))
+    return min(times)
+
+
+def main(repeat=20):
+    variants = [(backend, mode) for backend in scraper.available_json_backends()
+                for mode in ("plain", "memo", "warm")]
+    print(f"{'sport':<8}{'attrs':>7}{'distinct':>10}"
+          + "".join(f"{backend + ('' if mode == 'plain' else '+' + mode):>14}"
+                    for backend, mode in variants)
+          + "  (ms per page)")
+    for sport in sorted(scraper.SPORTS):
+        with open(os.path.join(PAGES_DIR, f'{sport}.html'), 'rb') as page_file:
+            attributes = page_attributes(page_file.read())
+
+        row = f"{sport:<8}{len(attributes):>7}{len(set(attributes)):>10}"
+        for backend, mode in variants:
+            seconds = time_decoding(attributes, backend, mode, repeat)
+            row += f"{seconds * 1000:>14.3f}"
+        print(row)
+
+
+if __name__ == '__main__':
+    main()
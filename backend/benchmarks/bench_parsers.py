@@ -0,0 +1,57 @@
+import os
+import sys
+import timeit
+import scrape_data as scraper
+
+# TO RUN, be at backend as current directory.  Run python -m benchmarks.bench_parsers
+# The pages are synthetic (see tests/make_pages.py), so the timings compare
+# the options with each other but aren't representative of the live site.
+
+PAGES_DIR = os.path.join(os.path.dirname(__file__), os.pardir, 'tests', 'pages')
+
+
+def scrape_page(sport, content, parser, strainer=scraper.PAGE_STRAINER):
+    """Parse a test page and scrape it in a single pass."""
+    page = scraper.parse_html(content, parser, strainer)
+    return scraper.scrape_page(sport, page, scraper.SELECTOR_PLAN)
+
+
+def scrape_page_by_container(sport, content):
+    """Scrape a test page the original way: the whole tree built with
+    html.parser and each kind of container found in its own traversal.
+    """
+    selectors = scraper.SELECTORS
+    page = scraper.parse_html(content, 'html.parser', None)
+    sportsbook_names = scraper.scrape_sportsbook_names(page, selectors)
+    matchup_containers = page.find_all('div', class_=selectors["matchups"])
+    matchups = scraper.scrape_matchups(sport, matchup_containers, selectors)
+    odds = [scraper.scrape_odds(container, sportsbook_names, selectors)
+            for container in page.select(selectors["odds"])]
+    return sportsbook_names, list(zip(matchups, odds))
+
+
+def main(repeat=20):
+    parsers = scraper.available_parsers()
+    # The last column is the original scrape, for comparison.
+    print(f"{'sport':<8}" + "".join(f"{parser:>14}" for parser in parsers)
+          + f"{'original':>14}  (ms per page)")
+    for sport in sorted(scraper.SPORTS):
+        with open(os.path.join(PAGES_DIR, f'{sport}.html'), 'rb') as page_file:
+            content = page_file.read()
+
+        baseline = scrape_page_by_container(sport, content)
+        row = f"{sport:<8}"
+        for parser in parsers:
+            if scrape_page(sport, content, parser) != baseline:
+                sys.exit(f"{parser} output differs from the original scrape for {sport}")
+            seconds = min(timeit.repeat(lambda: scrape_page(sport, content, parser),
+                                        number=1, repeat=repeat))
+            row += f"{seconds * 1000:>14.2f}"
+        seconds = min(timeit.repeat(lambda: scrape_page_by_container(sport, content),
+                                    number=1, repeat=repeat))
+        row += f"{seconds * 1000:>14.2f}"
+        print(row)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+import threading
+import time
+import requests
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of sending a request while its circuit is open.
+
+    It subclasses ConnectionError so callers treat it like the connection
+    failures that opened the circuit, just without waiting for one.
+    """
+
+
+class CircuitBreaker:
+    """Stops calling an upstream after repeated consecutive failures.
+
+    The circuit starts closed. After `failure_threshold` consecutive failures
+    it opens and every call fails immediately with CircuitOpenError. Once
+    `reset_timeout` seconds have passed it goes half-open and lets a single
+    probe call through: success closes the circuit again, failure re-opens it.
+    """
+
+    def __init__(self, name, failure_threshold=5, reset_timeout=30):
+        """
+        Args:
+            name (string): What the circuit protects, used in error messages.
+            failure_threshold (int): Consecutive failures that open the circuit.
+            reset_timeout (float): Seconds the circuit stays open before a
+                probe is allowed through.
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = None
+        self._probe_in_flight = False
+        self._short_circuits = 0
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """Check whether a call may go ahead.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with its
+                probe call already in flight.
+        """
+        with self._lock:
+            if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._state = HALF_OPEN
+            if self._state == CLOSED:
+                return
+            if self._state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return
+            self._short_circuits += 1
+        raise CircuitOpenError(f'Circuit for {self.name} is open')
+
+    def record_success(self):
+        """Record a successful call, closing the circuit."""
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        """Record a failed call, opening the circuit if it was the last straw."""
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+    def release(self):
+        """Forget a call that neither succeeded nor failed, so that a probe
+        slot it may have taken is given back.
+        """
+        with self._lock:
+            self._probe_in_flight = False
+
+    def stats(self):
+        """Return the circuit's state and counters."""
+        with self._lock:
+            return {
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "short_circuits": self._short_circuits,
+            }
@@ -0,0 +1,127 @@
+import threading
+import time
+from singleflight import SingleFlight
+
+
+# Cache statuses reported back to the caller (and to clients via headers).
+HIT = "HIT"
+STALE = "STALE"
+MISS = "MISS"
+
+
+class OddsCache:
+    """In-process cache of scraped matchups, keyed by sport.
+
+    An entry younger than its sport's ttl is served as a HIT. Once it is older
+    than `ttl` but still inside the `stale_ttl` window it is served as STALE
+    while a single background thread refreshes it. Anything older than that
+    (or missing) is a MISS and is loaded on the calling thread.
+
+    Loads and refreshes for the same sport go through a single-flight group,
+    so concurrent misses wait on one scrape and share its result.
+    """
+
+    def __init__(self, ttl, stale_ttl, ttl_for=None):
+        """
+        Args:
+            ttl (float): Seconds an entry is considered fresh.
+            stale_ttl (float): Extra seconds a stale entry may still be served
+                while it is refreshed in the background.
+            ttl_for (callable): Called with a sport to get the seconds its
+                entry is considered fresh instead of ttl, or None to use ttl.
+        """
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.ttl_for = ttl_for
+        self._entries = {}
+        self._refreshing = set()
+        self._flight = SingleFlight()
+        self._lock = threading.Lock()
+
+    def get(self, sport, loader):
+        """Return the matchups for a sport, loading them if needed.
+
+        Args:
+            sport (string): The sport to look up.
+            loader (callable): Called with the sport to scrape fresh matchups.
+
+        Returns:
+            Tuple: (matchups, status, age) where status is HIT, STALE or MISS
+            and age is the number of seconds since the matchups were scraped.
+        """
+        cached = self.lookup(sport, loader)
+        if cached is not None:
+            return cached
+
+        # Missing or too old to serve, so the caller has to wait on a scrape.
+        matchups = self._flight.do(sport, self._load, sport, loader)
+        return matchups, MISS, 0.0
+
+    def lookup(self, sport, loader):
+        """Like get(), but never waits on a scrape.
+
+        A STALE entry still starts its background refresh.
+
+        Returns:
+            Tuple or None: (matchups, status, age) for a HIT or STALE entry,
+            None for a MISS.
+        """
+        ttl = self.ttl_for(sport) if self.ttl_for is not None else None
+        if ttl is None:
+            ttl = self.ttl
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(sport)
+            if entry is None:
+                return None
+            matchups, stored_at = entry
+            age = now - stored_at
+            if age <= ttl:
+                return matchups, HIT, age
+            if age <= ttl + self.stale_ttl:
+                self._start_refresh(sport, loader)
+                return matchups, STALE, age
+            return None
+
+    def refresh(self, sport, loader):
+        """Load fresh matchups for a sport and store them, whatever the state
+        of its entry. Shares the single-flight group with get().
+
+        Returns:
+            List: The freshly loaded matchups.
+        """
+        return self._flight.do(sport, self._load, sport, loader)
+
+    def put(self, sport, matchups, age=0.0):
+        """Store matchups for a sport, as if scraped `age` seconds ago."""
+        with self._lock:
+            self._entries[sport] = (matchups, time.monotonic() - age)
+
+    def clear(self):
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def _start_refresh(self, sport, loader):
+        # Caller holds the lock. Only one refresh per sport at a time.
+        if sport in self._refreshing:
+            return
+        self._refreshing.add(sport)
+        thread = threading.Thread(
+            target=self._refresh, args=(sport, loader), daemon=True)
+        thread.start()
+
+    def _load(self, sport, loader):
+        matchups = loader(sport)
+        self.put(sport, matchups)
+        return matchups
+
+    def _refresh(self, sport, loader):
+        try:
+            self._flight.do(sport, self._load, sport, loader)
+        except Exception:
+            # Keep serving the stale entry; it will expire on its own.
+            pass
+        finally:
+            with self._lock:
+                self._refreshing.discard(sport)
@@ -0,0 +1,26 @@
+import json
+import sys
+import async_pipeline
+import pipeline
+import scrape_data as scraper
+
+
+def print_stage_timing(sport, stage, seconds):
+    """Pipeline stage hook that reports each stage's duration on stderr."""
+    print(f'{sport} {stage}: {seconds * 1000:.1f} ms', file=sys.stderr)
+
+
+# Scrape for given sport by running 'python cli.py sport' in cmd, or for
+# every sport at once with 'python cli.py all'.
+# Stage timings are printed to stderr.
+if __name__ == '__main__':
+    valid_sport = sys.argv[1] in scraper.SPORTS
+
+    if valid_sport:
+        pipeline.add_stage_hook(print_stage_timing)
+        print(json.dumps(pipeline.scrape_data_for(sys.argv[1]), indent=4))
+    elif sys.argv[1] == 'all':
+        pipeline.add_stage_hook(print_stage_timing)
+        print(json.dumps(async_pipeline.scrape_all(), indent=4))
+    else:
+        print(f'{sys.argv[1]} is not a supported argument. Try another.')
@@ -0,0 +1,43 @@
+import time
+import requests
+
+
+class DeadlineExceeded(requests.exceptions.Timeout):
+    """Raised when a scrape runs past its deadline.
+
+    It subclasses Timeout so callers handle it like any other request that
+    took too long.
+    """
+
+
+class Deadline:
+    """A point in time a piece of work has to be finished by."""
+
+    def __init__(self, seconds):
+        """
+        Args:
+            seconds (float): How long from now the deadline is.
+        """
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self):
+        """Return the seconds left until the deadline, negative once past it."""
+        return self.expires_at - time.monotonic()
+
+    def expired(self):
+        """Return True once the deadline has passed."""
+        return self.remaining() <= 0
+
+    def check(self, work):
+        """Make sure there is still time left before starting some work.
+
+        Args:
+            work (string): What is about to be done, used in the error message.
+
+        Raises:
+            DeadlineExceeded: If the deadline has already passed.
+        """
+        if self.expired():
+            raise DeadlineExceeded(
+                f'{self.seconds:g}s deadline exceeded before {work}')
@@ -0,0 +1,530 @@
+import collections
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from breaker import CircuitBreaker
+from deadline import DeadlineExceeded
+from proxies import PROXY_URLS, ProxyPool
+from ratelimit import RateLimited, RateLimiter
+
+# Number of hosts/proxies to keep connection pools for, and the number of
+# connections kept alive in each of those pools.
+POOL_CONNECTIONS = int(os.environ.get('OMNIBET_POOL_CONNECTIONS', 10))
+POOL_MAXSIZE = int(os.environ.get('OMNIBET_POOL_MAXSIZE', 10))
+
+# Seconds to wait for a connection to be established, and for each read from
+# it, before a request is abandoned. Requests made under a Deadline are given
+# at most the time it has left.
+CONNECT_TIMEOUT = float(os.environ.get('OMNIBET_CONNECT_TIMEOUT', 3.05))
+READ_TIMEOUT = float(os.environ.get('OMNIBET_READ_TIMEOUT', 10))
+
+# Largest read a response body is downloaded in when it has a deadline.
+BODY_CHUNK_SIZE = 16384
+
+# How many different proxies a request is tried through before giving up.
+PROXY_ATTEMPTS = int(os.environ.get('OMNIBET_PROXY_ATTEMPTS', 2))
+
+# Send requests using Proxy to bypass content restriction due to IP location.
+proxy_pool = ProxyPool(PROXY_URLS)
+
+# Errors that mean the proxy, rather than the page, is the problem.
+PROXY_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+# Circuit breaker per upstream host: after BREAKER_FAILURES consecutive
+# fetches that couldn't connect (through any proxy), fetches fail immediately
+# for BREAKER_RESET seconds, after which a single probe fetch is let through.
+BREAKER_FAILURES = int(os.environ.get('OMNIBET_BREAKER_FAILURES', 5))
+BREAKER_RESET = float(os.environ.get('OMNIBET_BREAKER_RESET', 30))
+
+# Token buckets every fetch has to take a token from: one shared by all
+# upstream requests (RATE_LIMIT per second, bursts of RATE_BURST) and one per
+# upstream host (HOST_RATE_LIMIT per second, bursts of HOST_RATE_BURST). A
+# fetch waits at most RATE_LIMIT_WAIT seconds for its tokens before giving
+# up with RateLimited. A rate of 0 turns that limit off.
+RATE_LIMIT = float(os.environ.get('OMNIBET_RATE_LIMIT', 2))
+RATE_BURST = float(os.environ.get('OMNIBET_RATE_BURST', 7))
+HOST_RATE_LIMIT = float(os.environ.get('OMNIBET_HOST_RATE_LIMIT', 1))
+HOST_RATE_BURST = float(os.environ.get('OMNIBET_HOST_RATE_BURST', 7))
+RATE_LIMIT_WAIT = float(os.environ.get('OMNIBET_RATE_LIMIT_WAIT', 2))
+
+rate_limiter = RateLimiter(RATE_LIMIT, RATE_BURST, HOST_RATE_LIMIT, HOST_RATE_BURST)
+
+# Hedged requests: when enabled, a request that hasn't answered within the
+# HEDGE_PERCENTILE of recent proxied request latencies is also sent through
+# another proxy, and whichever answers first wins. Until HEDGE_MIN_SAMPLES
+# latencies have been seen, HEDGE_DEFAULT_DELAY seconds is used instead.
+HEDGE_REQUESTS = os.environ.get('OMNIBET_HEDGE_REQUESTS') == '1'
+HEDGE_PERCENTILE = float(os.environ.get('OMNIBET_HEDGE_PERCENTILE', 95))
+HEDGE_DEFAULT_DELAY = float(os.environ.get('OMNIBET_HEDGE_DEFAULT_DELAY', 1.0))
+HEDGE_MIN_SAMPLES = 10
+
+
+class _ConnectionStats:
+    """Thread-safe counters for requests sent and connections opened."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.connections_opened = 0
+        self.not_modified = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def request_sent(self):
+        with self._lock:
+            self.requests += 1
+
+    def connection_opened(self):
+        with self._lock:
+            self.connections_opened += 1
+
+    def response_not_modified(self):
+        with self._lock:
+            self.not_modified += 1
+
+    def hedge_sent(self):
+        with self._lock:
+            self.hedges += 1
+
+    def hedge_won(self):
+        with self._lock:
+            self.hedge_wins += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "connections_opened": self.connections_opened,
+                "connections_reused": max(self.requests - self.connections_opened, 0),
+                "not_modified": self.not_modified,
+                "hedges": self.hedges,
+                "hedge_wins": self.hedge_wins,
+            }
+
+
+class _LatencyWindow:
+    """The most recent latencies of successful proxied requests."""
+
+    def __init__(self, size=200):
+        self._lock = threading.Lock()
+        self._latencies = collections.deque(maxlen=size)
+
+    def add(self, seconds):
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def percentile(self, percent, min_samples):
+        """Return the given percentile, or None with too few samples."""
+        with self._lock:
+            latencies = sorted(self._latencies)
+        if len(latencies) < min_samples:
+            return None
+        index = min(int(len(latencies) * percent / 100), len(latencies) - 1)
+        return latencies[index]
+
+
+class _ValidatorStore:
+    """Remembers each URL's validators together with the payload parsed from
+    the response they came from, so a 304 can be answered from memory.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    def request_headers(self, url):
+        with self._lock:
+            entry = self._entries.get(url)
+        return dict(entry[0]) if entry else {}
+
+    def remember(self, url, http_response, payload):
+        headers = {}
+        if http_response.headers.get('ETag'):
+            headers['If-None-Match'] = http_response.headers['ETag']
+        if http_response.headers.get('Last-Modified'):
+            headers['If-Modified-Since'] = http_response.headers['Last-Modified']
+        with self._lock:
+            if headers:
+                self._entries[url] = (headers, payload)
+            else:
+                self._entries.pop(url, None)
+
+    def payload(self, url):
+        with self._lock:
+            entry = self._entries.get(url)
+        return entry[1] if entry else None
+
+
+_stats = _ConnectionStats()
+_validators = _ValidatorStore()
+_latencies = _LatencyWindow()
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    def _new_conn(self):
+        _stats.connection_opened()
+        return super()._new_conn()
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    def _new_conn(self):
+        _stats.connection_opened()
+        return super()._new_conn()
+
+
+_COUNTING_POOL_CLASSES = {
+    "http": _CountingHTTPConnectionPool,
+    "https": _CountingHTTPSConnectionPool,
+}
+
+
+class _PooledAdapter(HTTPAdapter):
+    """HTTPAdapter whose pools (direct and per proxy) count new connections."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = _COUNTING_POOL_CLASSES
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        manager = super().proxy_manager_for(proxy, **proxy_kwargs)
+        manager.pool_classes_by_scheme = _COUNTING_POOL_CLASSES
+        return manager
+
+    def send(self, request, **kwargs):
+        _stats.request_sent()
+        return super().send(request, **kwargs)
+
+
+# One adapter, and therefore one set of keep-alive pools, shared by every
+# thread. Each thread gets its own Session on top of it because Session state
+# (cookies, hooks) isn't safe to share between threads.
+_adapter = _PooledAdapter(pool_connections=POOL_CONNECTIONS,
+                          pool_maxsize=POOL_MAXSIZE)
+_local = threading.local()
+
+# Threads that run the competing requests of a hedged fetch.
+_hedge_executor = ThreadPoolExecutor(max_workers=POOL_MAXSIZE)
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def circuit_breaker_for(url):
+    """Return the circuit breaker guarding fetches of the URL's host."""
+    host = urlsplit(url).netloc
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(host, BREAKER_FAILURES, BREAKER_RESET)
+            _breakers[host] = breaker
+        return breaker
+
+
+def circuit_stats():
+    """Return the state of the circuit breaker of every upstream host."""
+    with _breakers_lock:
+        breakers = dict(_breakers)
+    return {host: breaker.stats() for host, breaker in breakers.items()}
+
+
+def get_session():
+    """Return this thread's Session, backed by the shared connection pools."""
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.mount("http://", _adapter)
+        session.mount("https://", _adapter)
+        _local.session = session
+    return session
+
+
+def request_timeout(deadline=None):
+    """Return the (connect, read) timeout to send a request with.
+
+    Args:
+        deadline (Deadline): The deadline the request has to finish by, if any.
+
+    Raises:
+        DeadlineExceeded: If the deadline has already passed.
+    """
+    if deadline is None:
+        return (CONNECT_TIMEOUT, READ_TIMEOUT)
+    deadline.check('sending the request')
+    remaining = deadline.remaining()
+    return (min(CONNECT_TIMEOUT, remaining), min(READ_TIMEOUT, remaining))
+
+
+def fetch(url, proxies=None, conditional=False, deadline=None, **kwargs):
+    """Send a GET request over a pooled, keep-alive connection.
+
+    With conditional=True the validators remembered for the URL (see
+    remember_payload) are sent as If-None-Match / If-Modified-Since headers,
+    so an unchanged page comes back as a bodiless 304 Not Modified.
+
+    Unless proxies are given, the request goes through the best proxy in
+    proxy_pool, and is retried through up to PROXY_ATTEMPTS different
+    proxies when a proxy fails to connect. With HEDGE_REQUESTS on, a slow
+    request is also raced against another proxy (see _fetch_hedged).
+
+    Every fetch of a host goes through that host's circuit breaker, so once
+    the host is unreachable further fetches raise CircuitOpenError (a
+    ConnectionError) immediately instead of waiting to fail.
+
+    Every request is sent with CONNECT_TIMEOUT and READ_TIMEOUT, capped to
+    what is left of the deadline, unless a timeout is given explicitly. With
+    a deadline, the body is downloaded before fetch returns (unless
+    stream=True is passed) and the deadline is checked between reads.
+
+    Once the circuit breaker lets the fetch through, it takes a token from
+    rate_limiter, waiting up to RATE_LIMIT_WAIT seconds (or what is left of
+    the deadline) for one.
+
+    Args:
+        url (string): The page to request.
+        proxies (dict): Proxies to send the request through. Defaults to
+            picking from proxy_pool.
+        conditional (bool): Whether to send a conditional request.
+        deadline (Deadline): When the fetch, retries and hedges included,
+            has to be finished by.
+
+    Returns:
+        Response: The response, with raise_for_status() already called.
+
+    Raises:
+        DeadlineExceeded: If the deadline passed before a response arrived.
+        RateLimited: If no token became available in time.
+    """
+    if conditional:
+        headers = _validators.request_headers(url)
+        headers.update(kwargs.pop('headers', None) or {})
+        kwargs['headers'] = headers
+
+    # Running out of time before even starting isn't the upstream's fault, so
+    # don't let it count against the circuit breaker.
+    if deadline is not None:
+        deadline.check('fetching')
+
+    # Fails fast with CircuitOpenError while the upstream is known to be down,
+    # before spending a token (or waiting for one) on a request never sent.
+    breaker = circuit_breaker_for(url)
+    breaker.before_call()
+
+    # Being turned away by the rate limiter isn't the upstream's fault either,
+    # so it gives back a half-open probe slot instead of counting as a failure.
+    host = urlsplit(url).netloc
+    wait = RATE_LIMIT_WAIT
+    if deadline is not None:
+        wait = min(wait, max(deadline.remaining(), 0.0))
+    if not rate_limiter.acquire(host, wait):
+        breaker.release()
+        raise RateLimited(f'Too many requests to {host}, try again later')
+
+    try:
+        if proxies is not None or len(proxy_pool) == 0:
+            http_response = _get(url, proxies, deadline, **kwargs)
+        else:
+            http_response = _fetch_through_pool(url, deadline, **kwargs)
+    except PROXY_ERRORS:
+        breaker.record_failure()
+        raise
+    except BaseException:
+        breaker.release()
+        raise
+    breaker.record_success()
+
+    http_response.raise_for_status()
+    if is_not_modified(http_response):
+        _stats.response_not_modified()
+    return http_response
+
+
+def _get(url, proxies, deadline, **kwargs):
+    if 'timeout' not in kwargs:
+        kwargs['timeout'] = request_timeout(deadline)
+    if deadline is None or kwargs.get('stream'):
+        return get_session().get(url, proxies=proxies, **kwargs)
+
+    # The timeouts only bound each read from the socket, so a body trickling
+    # in could still outlast the deadline. Download it here instead, checking
+    # the deadline between reads.
+    kwargs['stream'] = True
+    http_response = get_session().get(url, proxies=proxies, **kwargs)
+    try:
+        chunks = []
+        for chunk in _body_chunks(http_response):
+            chunks.append(chunk)
+            deadline.check('downloading the response')
+    except BaseException:
+        http_response.close()
+        raise
+    http_response._content = b''.join(chunks)
+    http_response._content_consumed = True
+    return http_response
+
+
+def _body_chunks(http_response):
+    # read1() returns whatever has arrived so far, where iter_content() waits
+    # for a whole chunk; older urllib3 versions only have the latter.
+    read1 = getattr(http_response.raw, 'read1', None)
+    if read1 is None:
+        yield from http_response.iter_content(BODY_CHUNK_SIZE)
+        return
+    while True:
+        chunk = read1(BODY_CHUNK_SIZE, decode_content=True)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _fetch_via(proxy, url, deadline=None, **kwargs):
+    recorded = False
+    try:
+        # A blown deadline says nothing about the proxy's health.
+        if deadline is not None:
+            deadline.check('sending the request')
+        start = time.perf_counter()
+        try:
+            http_response = _get(url, {"http": proxy, "https": proxy}, deadline, **kwargs)
+        except PROXY_ERRORS:
+            recorded = True
+            proxy_pool.record_failure(proxy)
+            raise
+        seconds = time.perf_counter() - start
+        recorded = True
+        proxy_pool.record_success(proxy, seconds)
+        _latencies.add(seconds)
+        return http_response
+    finally:
+        if not recorded:
+            # Neither a success nor a failure of the proxy.
+            proxy_pool.release(proxy)
+
+
+def _fetch_through_pool(url, deadline=None, **kwargs):
+    if HEDGE_REQUESTS:
+        return _fetch_hedged(url, deadline, **kwargs)
+
+    tried = []
+    while True:
+        proxy = proxy_pool.choose(exclude=tried)
+        tried.append(proxy)
+        try:
+            return _fetch_via(proxy, url, deadline, **kwargs)
+        except DeadlineExceeded:
+            raise
+        except PROXY_ERRORS:
+            if len(tried) >= min(PROXY_ATTEMPTS, len(proxy_pool)):
+                raise
+
+
+def hedge_delay():
+    """Return how long a hedged fetch waits before trying a second proxy."""
+    delay = _latencies.percentile(HEDGE_PERCENTILE, HEDGE_MIN_SAMPLES)
+    return HEDGE_DEFAULT_DELAY if delay is None else delay
+
+
+def _close_response(future):
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+def _cancel_all(in_flight):
+    for future, proxy in in_flight.items():
+        if future.cancel():
+            # Never sent, so _fetch_via won't report on the proxy.
+            proxy_pool.release(proxy)
+        future.add_done_callback(_close_response)
+
+
+def _fetch_hedged(url, deadline=None, **kwargs):
+    """Fetch through one proxy, and through a second one as well if the
+    first hasn't answered within hedge_delay() or has failed. The first
+    response wins; the losing request is cancelled if it hasn't started,
+    otherwise its response is closed as soon as it arrives. The same happens
+    to every request still in flight when the deadline passes.
+    """
+    max_proxies = min(PROXY_ATTEMPTS, len(proxy_pool))
+    tried = []
+    in_flight = {}
+    # Requests raced against a slow one, as opposed to retries of failed ones.
+    hedges = set()
+
+    def launch():
+        proxy = proxy_pool.choose(exclude=tried)
+        if proxy is None:
+            return None
+        tried.append(proxy)
+        future = _hedge_executor.submit(_fetch_via, proxy, url, deadline, **kwargs)
+        in_flight[future] = proxy
+        return future
+
+    launch()
+    last_error = None
+    while in_flight:
+        can_hedge = len(tried) < max_proxies
+        timeout = hedge_delay() if can_hedge else None
+        if deadline is not None:
+            remaining = max(deadline.remaining(), 0.0)
+            timeout = remaining if timeout is None else min(timeout, remaining)
+        done, _ = wait(list(in_flight), timeout=timeout, return_when=FIRST_COMPLETED)
+        if not done and deadline is not None and deadline.expired():
+            _cancel_all(in_flight)
+            deadline.check('a hedged request answered')
+        if not done:
+            # Too slow: race the request against another proxy.
+            hedge = launch()
+            if hedge is not None:
+                hedges.add(hedge)
+                _stats.hedge_sent()
+            else:
+                max_proxies = len(tried)
+            continue
+
+        for future in done:
+            in_flight.pop(future)
+            if future.exception() is None:
+                _cancel_all(in_flight)
+                if future in hedges:
+                    _stats.hedge_won()
+                return future.result()
+            last_error = future.exception()
+
+        if isinstance(last_error, DeadlineExceeded):
+            _cancel_all(in_flight)
+            break
+        # Every request so far failed; fall back to the next proxy, if any.
+        if not in_flight and len(tried) < max_proxies:
+            launch()
+    raise last_error
+
+
+def is_not_modified(http_response):
+    """Return True if the response is a 304 to a conditional request."""
+    return http_response.status_code == 304
+
+
+def remember_payload(url, http_response, payload):
+    """Remember the response's validators along with what was parsed from it.
+
+    Args:
+        url (string): The page that was requested.
+        http_response (Response): The full 200 response for the page.
+        payload: The result of parsing the response, returned by
+            previous_payload() once the page comes back not modified.
+    """
+    _validators.remember(url, http_response, payload)
+
+
+def previous_payload(url):
+    """Return the payload remembered for the URL, or None."""
+    return _validators.payload(url)
+
+
+def connection_stats():
+    """Return how many requests were sent and how many reused a connection."""
+    return _stats.snapshot()
@@ -0,0 +1,58 @@
+from selectolax.lexbor import LexborHTMLParser
+
+
+def _css_for(name, class_):
+    """Translate a find()/find_all() style query into a CSS selector.
+
+    Like BeautifulSoup, a class_ containing spaces has to match the whole
+    class attribute, while a single class matches any element carrying it.
+    """
+    if class_ is None:
+        return name
+    if ' ' in class_:
+        return f'{name}[class="{class_}"]'
+    return f'{name}.{class_}'
+
+
+class LexborTag:
+    """A selectolax/lexbor node exposed through the subset of bs4's Tag
+    interface that the scrape functions in scrape_data rely on (find,
+    find_all, select, get_text, name, attribute lookup and previous_sibling),
+    so they run unchanged on top of the much faster C parser.
+    """
+
+    def __init__(self, node):
+        self._node = node
+
+    def __getitem__(self, attribute):
+        value = self._node.attributes[attribute]
+        if attribute == 'class':
+            return value.split() if value else []
+        return value
+
+    @property
+    def name(self):
+        return self._node.tag
+
+    @property
+    def previous_sibling(self):
+        sibling = self._node.prev
+        return LexborTag(sibling) if sibling is not None else None
+
+    def find(self, name, class_=None):
+        node = self._node.css_first(_css_for(name, class_))
+        return LexborTag(node) if node is not None else None
+
+    def find_all(self, name, class_=None):
+        return [LexborTag(node) for node in self._node.css(_css_for(name, class_))]
+
+    def select(self, selector):
+        return [LexborTag(node) for node in self._node.css(selector)]
+
+    def get_text(self):
+        return self._node.text(deep=True)
+
+
+def parse(content):
+    """Parse an HTML document and return its root as a LexborTag."""
+    return LexborTag(LexborHTMLParser(content).root)
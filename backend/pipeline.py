@@ -0,0 +1,321 @@
+import collections
+import concurrent.futures
+import contextlib
+import multiprocessing
+import os
+import threading
+import time
+import requests
+import betting_calculations as bc
+import http_client
+import scrape_data as scraper
+from deadline import Deadline
+from snapshots import SnapshotStore
+
+# The stages every scrape goes through, in order.
+STAGES = ("fetch", "parse", "weave", "enrich")
+
+# Seconds a whole scrape, from the first request to the last stage, may take.
+SCRAPE_DEADLINE = float(os.environ.get('OMNIBET_SCRAPE_DEADLINE', 20))
+
+# Worker processes the parse, weave and enrich stages run in, so concurrent
+# scrapes parse on several cores instead of taking turns holding the GIL.
+# With 0 they run on the calling thread.
+PARSE_PROCESSES = int(os.environ.get('OMNIBET_PARSE_PROCESSES', 0))
+
+# Parse pages while they download: the body is read STREAM_CHUNK_SIZE bytes
+# at a time and fed straight to an incremental tokenizer, so parsing overlaps
+# the download and neither the whole body nor a tree is ever held in memory.
+# Takes precedence over PARSE_PROCESSES, as the parse has to happen where the
+# response is read.
+STREAM_PARSE = os.environ.get('OMNIBET_STREAM_PARSE') == '1'
+STREAM_CHUNK_SIZE = int(os.environ.get('OMNIBET_STREAM_CHUNK_SIZE', 16384))
+
+_stage_hooks = []
+
+_parse_pool = None
+_parse_pool_lock = threading.Lock()
+
+_deadline_misses = collections.Counter()
+_deadline_misses_lock = threading.Lock()
+
+
+def add_stage_hook(hook):
+    """Register a function called after every pipeline stage.
+
+    Args:
+        hook (callable): Called as hook(sport, stage, seconds) where stage is
+            one of STAGES and seconds is how long the stage took.
+    """
+    _stage_hooks.append(hook)
+
+
+def remove_stage_hook(hook):
+    """Unregister a function added with add_stage_hook()."""
+    _stage_hooks.remove(hook)
+
+
+def _report(sport, stage, seconds):
+    for hook in list(_stage_hooks):
+        hook(sport, stage, seconds)
+
+
+def _timed(sport, stage, fn, *args, report=_report):
+    start = time.perf_counter()
+    try:
+        return fn(*args)
+    finally:
+        report(sport, stage, time.perf_counter() - start)
+
+
+class StageTimings:
+    """Stage hook that aggregates how long each pipeline stage takes."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._timings = {stage: {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+                         for stage in STAGES}
+
+    def record(self, sport, stage, seconds):
+        with self._lock:
+            timing = self._timings[stage]
+            timing["count"] += 1
+            timing["total_seconds"] += seconds
+            timing["max_seconds"] = max(timing["max_seconds"], seconds)
+
+    def snapshot(self):
+        with self._lock:
+            return {stage: dict(timing) for stage, timing in self._timings.items()}
+
+
+def deadline_misses():
+    """Return how many scrapes of each sport ran past their deadline."""
+    with _deadline_misses_lock:
+        return dict(_deadline_misses)
+
+
+def odds_url(sport):
+    """Returns the oddsshark.com page listing a sport's odds."""
+    return f'https://www.oddsshark.com/{sport}/odds'
+
+
+def fetch(url, deadline=None):
+    """Fetch stage: conditionally request the odds page.
+
+    Raises:
+        RequestException: If the page couldn't be fetched.
+    """
+    return http_client.fetch(url, conditional=True, deadline=deadline,
+                             stream=STREAM_PARSE)
+
+
+def parse(content):
+    """Parse stage: build the page tree."""
+    return scraper.parse_html(content)
+
+
+def parse_stream(sport, http_response, deadline):
+    """Parse stage when streaming: scrape the page as its body arrives.
+
+    Returns:
+        OddsExtractor: The scraped page, for the weave stage.
+    """
+    with http_response:
+        return scraper.scrape_stream(
+            sport, http_response.iter_content(STREAM_CHUNK_SIZE), deadline=deadline)
+
+
+def weave(sport, page):
+    """Weave stage: scrape the page and attach each team's odds to its matchup.
+
+    Returns:
+        List: Dict holding information for each matchup.
+    """
+    sportsbook_names, rows = scraper.scrape_page(sport, page, scraper.SELECTOR_PLAN)
+    matchups = []
+    for matchup, matchup_odds in rows:
+        for team in ["team_1", "team_2"]:
+            matchup[team]["odds"] = matchup_odds[team]
+        matchups.append(matchup)
+    return matchups
+
+
+def enrich(matchups):
+    """Enrich stage: add betting metrics to each team of each matchup."""
+    for matchup in matchups:
+        for team in ["team_1", "team_2"]:
+            team_odds = matchup[team]["odds"]
+            max_profit_odd = bc.optimal_odd_to_bet(team_odds)
+            matchup[team]["money_multiplier"] = bc.money_multiplier(max_profit_odd)
+            matchup[team]["win_probability"] = bc.win_probability_from_odds(team_odds)
+    return matchups
+
+
+def scrape_data_for(sport):
+    """Scrape oddsshark.com for a sport, falling back to old data on failure.
+
+    Successful scrapes are saved as the sport's snapshot. On failure the
+    saved snapshot is returned, or the "fake" data if there isn't one.
+
+    Args:
+        sport (string): The sport on oddsshark.com to scrape odds for.
+
+    Returns:
+        List: JSON object for each matchup.
+    """
+    snapshot_store = SnapshotStore()
+    try:
+        matchups = run(sport)
+    except Exception:
+        # Proxy and HTTP errors as well as pages that failed to scrape.
+        return fallback_data_for(sport, snapshot_store)
+    snapshot_store.save(sport, matchups)
+    return matchups
+
+
+def fallback_data_for(sport, snapshot_store):
+    """Return the sport's saved snapshot, or its "fake" data if there isn't one."""
+    if snapshot_store.load([sport]):
+        return snapshot_store.get(sport)
+    return bc.get_fake_data(sport)
+
+
+def run(sport, deadline=None):
+    """Scrape oddsshark.com for a sport's matchups and betting metrics.
+
+    Runs the fetch, parse, weave and enrich stages in order, timing each one.
+    When the page hasn't changed since the last scrape the matchups parsed
+    from it last time are returned and the remaining stages are skipped.
+
+    The requests are bounded by the deadline, and once it has passed the
+    remaining stages are skipped rather than doing work nobody will wait for.
+    Every scrape that runs out of time is counted in deadline_misses().
+
+    Args:
+        sport (string): The name of the sport to scrape info for.
+        deadline (Deadline): When the scrape has to be finished by. Defaults
+            to SCRAPE_DEADLINE seconds from now.
+
+    Returns:
+        List: Dict holding information for each matchup.
+
+    Raises:
+        RequestException: If the page couldn't be fetched.
+        DeadlineExceeded: If the deadline passed before the scrape finished.
+    """
+    deadline = deadline or Deadline(SCRAPE_DEADLINE)
+    with track_deadline(sport, deadline):
+        http_response = run_fetch(sport, deadline)
+        return run_processing(sport, http_response, deadline)
+
+
+@contextlib.contextmanager
+def track_deadline(sport, deadline):
+    """Count a timeout raised inside the block as a deadline miss of the
+    sport if the deadline has passed by then.
+    """
+    try:
+        yield deadline
+    except requests.exceptions.Timeout:
+        # Includes request timeouts that were cut short by the deadline.
+        if deadline.expired():
+            with _deadline_misses_lock:
+                _deadline_misses[sport] += 1
+        raise
+
+
+def run_fetch(sport, deadline):
+    """Run the fetch stage of a scrape.
+
+    Returns:
+        Response: The sport's odds page, possibly a 304 Not Modified.
+    """
+    return _timed(sport, "fetch", fetch, odds_url(sport), deadline)
+
+
+def run_processing(sport, http_response, deadline):
+    """Run the stages after fetch on the page run_fetch() returned.
+
+    Returns:
+        List: Dict holding information for each matchup.
+    """
+    url = odds_url(sport)
+    if http_client.is_not_modified(http_response):
+        # A streamed response holds on to its connection until closed.
+        http_response.close()
+        return http_client.previous_payload(url)
+
+    if STREAM_PARSE:
+        matchups = _run_page_stages(
+            sport, http_response,
+            lambda response: parse_stream(sport, response, deadline),
+            deadline, _report)
+    elif PARSE_PROCESSES > 0:
+        deadline.check("parsing")
+        future = _get_parse_pool().submit(
+            process_page, sport, http_response.content, deadline)
+        try:
+            matchups, timings = future.result(timeout=max(deadline.remaining(), 0.0))
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            deadline.check("the page was processed")
+            raise
+        for stage, seconds in timings:
+            _report(sport, stage, seconds)
+    else:
+        matchups, _ = process_page(sport, http_response.content, deadline, _report)
+    http_client.remember_payload(url, http_response, matchups)
+    return matchups
+
+
+def process_page(sport, content, deadline, report=None):
+    """Run the parse, weave and enrich stages on a page.
+
+    Only takes and returns plain, picklable values, so it can run in one of
+    the PARSE_PROCESSES worker processes.
+
+    Args:
+        sport (string): The sport the page lists odds for.
+        content (bytes): The page's HTML.
+        deadline (Deadline): When the scrape has to be finished by.
+        report (callable): Called as report(sport, stage, seconds) after
+            every stage. Defaults to collecting the timings to return.
+
+    Returns:
+        Tuple: (matchups, timings) where matchups are the plain dicts holding
+        information for each matchup and timings lists a (stage, seconds)
+        pair per stage that wasn't passed to report.
+    """
+    timings = []
+    if report is None:
+        report = lambda sport, stage, seconds: timings.append((stage, seconds))
+    return _run_page_stages(sport, content, parse, deadline, report), timings
+
+
+def _run_page_stages(sport, source, parse_fn, deadline, report):
+    deadline.check("parsing")
+    page = _timed(sport, "parse", parse_fn, source, report=report)
+    deadline.check("weaving")
+    matchups = _timed(sport, "weave", weave, sport, page, report=report)
+    return _timed(sport, "enrich", enrich, matchups, report=report)
+
+
+def _get_parse_pool():
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            # Spawned rather than forked: forking a process that runs server
+            # and pool threads can copy a lock some thread is holding.
+            _parse_pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=PARSE_PROCESSES,
+                mp_context=multiprocessing.get_context("spawn"))
+        return _parse_pool
+
+
+def shutdown_parse_pool():
+    """Stop the worker processes, if any were started."""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is not None:
+            _parse_pool.shutdown(cancel_futures=True)
+            _parse_pool = None
@@ -0,0 +1,152 @@
+import os
+import threading
+import time
+
+# Proxies scrapes are sent through to bypass content restriction due to IP
+# location; override with a comma separated OMNIBET_PROXIES, or set it to an
+# empty string to connect directly.
+PROXY_URLS = [url.strip() for url in os.environ.get(
+    'OMNIBET_PROXIES', 'http://52.183.8.192:3128').split(',') if url.strip()]
+
+
+class _ProxyHealth:
+    """Rolling health scores of a single proxy."""
+
+    def __init__(self, url):
+        self.url = url
+        self.success_rate = 1.0
+        self.latency = None
+        self.samples = 0
+        self.ejected_until = None
+        self.probing = False
+
+
+class ProxyPool:
+    """A set of proxies scored by rolling success rate and latency.
+
+    choose() prefers the fastest, most reliable healthy proxy, trying proxies
+    that have never been used first so every proxy gets a latency score. A proxy whose success
+    rate drops below `eject_below` is ejected for `cooldown` seconds; after
+    that the next choose() hands it out once as a probe, and a successful
+    probe puts it back in rotation. Every proxy choose() returns has to be
+    given a result with record_success() or record_failure(), or be handed
+    back with release() if its request was never answered.
+    """
+
+    def __init__(self, proxy_urls, smoothing=0.2, eject_below=0.5, min_samples=3,
+                 cooldown=60):
+        """
+        Args:
+            proxy_urls (list): Proxy URLs, e.g. "http://52.183.8.192:3128".
+            smoothing (float): Weight of the newest sample in the rolling
+                success rate and latency.
+            eject_below (float): Success rate under which a proxy is ejected.
+            min_samples (int): Requests a proxy must have made before it can be
+                ejected.
+            cooldown (float): Seconds an ejected proxy waits to be re-probed.
+        """
+        self.smoothing = smoothing
+        self.eject_below = eject_below
+        self.min_samples = min_samples
+        self.cooldown = cooldown
+        self._proxies = {url: _ProxyHealth(url) for url in proxy_urls}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._proxies)
+
+    def choose(self, exclude=()):
+        """Pick the proxy to send the next request through.
+
+        Args:
+            exclude (iterable): Proxies not to pick, e.g. ones already tried.
+
+        Returns:
+            String: A proxy URL, or None if every proxy is excluded.
+        """
+        now = time.monotonic()
+        with self._lock:
+            candidates = [proxy for url, proxy in self._proxies.items()
+                          if url not in exclude]
+            if not candidates:
+                return None
+
+            healthy = [proxy for proxy in candidates if proxy.ejected_until is None]
+            for proxy in candidates:
+                if (proxy.ejected_until is not None and not proxy.probing
+                        and proxy.ejected_until <= now):
+                    proxy.probing = True
+                    return proxy.url
+            if healthy:
+                return min(healthy, key=self._score).url
+
+            # Every proxy is ejected; the one due to be re-probed soonest is
+            # better than not scraping at all.
+            return min(candidates, key=lambda proxy: proxy.ejected_until).url
+
+    @staticmethod
+    def _score(proxy):
+        # Lower is better: untried proxies first, then by latency inflated by
+        # the failure rate. Proxies that never answered come last.
+        if proxy.samples == 0:
+            return (0, 0.0)
+        if proxy.latency is None:
+            return (2, -proxy.success_rate)
+        return (1, proxy.latency / proxy.success_rate)
+
+    def record_success(self, url, seconds):
+        """Record that a request through the proxy got a response."""
+        with self._lock:
+            proxy = self._proxies.get(url)
+            if proxy is None:
+                return
+            proxy.samples += 1
+            proxy.success_rate += self.smoothing * (1.0 - proxy.success_rate)
+            if proxy.latency is None:
+                proxy.latency = seconds
+            else:
+                proxy.latency += self.smoothing * (seconds - proxy.latency)
+            if proxy.ejected_until is not None:
+                # A successful probe puts the proxy back in rotation.
+                proxy.ejected_until = None
+                proxy.probing = False
+                proxy.success_rate = 1.0
+
+    def record_failure(self, url):
+        """Record that a request through the proxy failed to connect."""
+        with self._lock:
+            proxy = self._proxies.get(url)
+            if proxy is None:
+                return
+            proxy.samples += 1
+            proxy.success_rate -= self.smoothing * proxy.success_rate
+            ejectable = proxy.samples >= self.min_samples or proxy.probing
+            if ejectable and proxy.success_rate < self.eject_below:
+                proxy.ejected_until = time.monotonic() + self.cooldown
+                proxy.probing = False
+
+    def release(self, url):
+        """Hand back a proxy from choose() whose request got no result, e.g.
+        because it was cancelled or ran out of time before being sent, so an
+        ejected proxy that was handed out as a probe can be probed again.
+        """
+        with self._lock:
+            proxy = self._proxies.get(url)
+            if proxy is not None:
+                proxy.probing = False
+
+    def stats(self):
+        """Return the health scores of every proxy."""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                url: {
+                    "success_rate": proxy.success_rate,
+                    "latency_seconds": proxy.latency,
+                    "requests": proxy.samples,
+                    "ejected": proxy.ejected_until is not None,
+                    "reprobe_in_seconds": (max(proxy.ejected_until - now, 0.0)
+                                           if proxy.ejected_until is not None else None),
+                }
+                for url, proxy in self._proxies.items()
+            }
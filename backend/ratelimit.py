@@ -0,0 +1,122 @@
+import threading
+import time
+import requests
+
+
+class RateLimited(requests.exceptions.RequestException):
+    """Raised instead of sending a request when no token became available in
+    time, so the caller can serve what it already has instead.
+    """
+
+
+class TokenBucket:
+    """Holds up to `capacity` tokens, refilled at `rate` tokens per second.
+
+    Not thread-safe on its own; RateLimiter guards its buckets with one lock
+    so a request can take a token from several buckets at once.
+    """
+
+    def __init__(self, rate, capacity):
+        """
+        Args:
+            rate (float): Tokens added per second.
+            capacity (float): Most tokens the bucket holds, i.e. the largest
+                burst of requests it lets through at once.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._updated_at = time.monotonic()
+
+    def wait_time(self, now):
+        """Return how many seconds until a token is available, 0 if one is."""
+        # `now` may predate the bucket if it was read before it was created.
+        if now > self._updated_at:
+            self.tokens = min(self.capacity,
+                              self.tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def take(self):
+        """Remove a token; only call after wait_time() returned 0."""
+        self.tokens -= 1
+
+
+class RateLimiter:
+    """A global token bucket plus one token bucket per key (e.g. per host).
+
+    A request needs a token from both buckets. Requests queue for a token for
+    a bounded time and are turned away once that time is up, which keeps the
+    rate of upstream requests fixed however many users are waiting on them.
+    A rate of 0 or less leaves that bucket unlimited.
+    """
+
+    def __init__(self, rate, burst, key_rate, key_burst):
+        """
+        Args:
+            rate (float): Requests per second allowed overall.
+            burst (float): Requests allowed at once overall.
+            key_rate (float): Requests per second allowed per key.
+            key_burst (float): Requests allowed at once per key.
+        """
+        self._global = TokenBucket(rate, burst) if rate > 0 else None
+        self.key_rate = key_rate
+        self.key_burst = key_burst
+        self._buckets = {}
+        self._admitted = 0
+        self._delayed = 0
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, key, timeout):
+        """Wait for a token from the global bucket and the key's bucket.
+
+        Args:
+            key (string): Which per-key bucket to take a token from.
+            timeout (float): Longest time to wait for the tokens.
+
+        Returns:
+            Bool: True once the tokens were taken, False if that would have
+            taken longer than timeout.
+        """
+        give_up_at = time.monotonic() + timeout
+        delayed = False
+        while True:
+            now = time.monotonic()
+            with self._lock:
+                buckets = self._buckets_for(key)
+                wait = max([bucket.wait_time(now) for bucket in buckets], default=0.0)
+                if wait == 0:
+                    for bucket in buckets:
+                        bucket.take()
+                    self._admitted += 1
+                    self._delayed += delayed
+                    return True
+                if now + wait > give_up_at:
+                    self._rejected += 1
+                    return False
+            delayed = True
+            time.sleep(wait)
+
+    def stats(self):
+        """Return how many requests were admitted (and of those, how many had
+        to wait) and how many were turned away.
+        """
+        with self._lock:
+            return {
+                "admitted": self._admitted,
+                "delayed": self._delayed,
+                "rejected": self._rejected,
+            }
+
+    def _buckets_for(self, key):
+        # Caller holds the lock.
+        buckets = [self._global] if self._global is not None else []
+        if self.key_rate > 0:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(self.key_rate, self.key_burst)
+            buckets.append(bucket)
+        return buckets
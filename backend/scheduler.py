@@ -0,0 +1,187 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+
+def odds_fingerprint(matchups):
+    """Return a value that changes whenever any odds in the matchups change."""
+    return hash(tuple(
+        (team["full_name"], tuple(sorted((team.get("odds") or {}).items())))
+        for matchup in matchups
+        for team in (matchup["team_1"], matchup["team_2"])
+    ))
+
+
+class RefreshScheduler:
+    """Background thread that re-scrapes every sport on its own cadence.
+
+    Each sport is refreshed as soon as the scheduler starts and then on an
+    interval that adapts to how often its odds actually move: it halves
+    (down to `min_interval`) after a refresh that changed the odds and grows
+    by half (up to `max_interval`) after one that didn't. While one of the
+    sport's games starts (or started) within `game_window` seconds of now it
+    is refreshed at least every `game_interval` seconds, since that's when
+    lines move the most.
+    """
+
+    # How the adaptive interval is scaled after a refresh that did or didn't
+    # change the odds.
+    SPEED_UP = 0.5
+    SLOW_DOWN = 1.5
+
+    def __init__(self, sports, refresh, interval, game_interval, game_window,
+                 executor=None, min_interval=None, max_interval=None):
+        """
+        Args:
+            sports (iterable): The sports to keep refreshed.
+            refresh (callable): Called with a sport to scrape it and store the
+                result; returns the scraped matchups.
+            interval (float): Seconds between refreshes of a sport, before any
+                adapting.
+            game_interval (float): Longest wait between refreshes of a sport
+                with a game close to its start time.
+            game_window (float): How close to a game's start time, in seconds,
+                the tighter cadence applies.
+            executor (Executor): Runs the refreshes. Defaults to a thread pool
+                with a worker per sport.
+            min_interval (float): Lower bound of the adaptive interval.
+                Defaults to interval.
+            max_interval (float): Upper bound of the adaptive interval.
+                Defaults to interval.
+        """
+        self.sports = list(sports)
+        self.interval = interval
+        self.game_interval = game_interval
+        self.game_window = game_window
+        self.min_interval = interval if min_interval is None else min_interval
+        self.max_interval = interval if max_interval is None else max_interval
+        self._refresh_fn = refresh
+        self._executor = executor or ThreadPoolExecutor(max_workers=len(self.sports))
+        self._next_due = {sport: 0.0 for sport in self.sports}
+        self._intervals = {sport: interval for sport in self.sports}
+        self._adaptive_intervals = {sport: interval for sport in self.sports}
+        self._fingerprints = {}
+        self._refreshes = {sport: 0 for sport in self.sports}
+        self._changes = {sport: 0 for sport in self.sports}
+        self._running = set()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start refreshing in a daemon thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        name="refresh-scheduler")
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        """Stop scheduling refreshes. Refreshes already running still finish."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def running(self):
+        """Return True while the scheduler is started."""
+        return self._thread is not None
+
+    def intervals(self):
+        """Return the refresh interval, in seconds, currently used per sport."""
+        with self._lock:
+            return dict(self._intervals)
+
+    def stats(self):
+        """Return each sport's current interval along with how many refreshes
+        it has had and how many of them changed its odds.
+        """
+        with self._lock:
+            return {
+                sport: {
+                    "interval": self._intervals[sport],
+                    "refreshes": self._refreshes[sport],
+                    "odds_changes": self._changes[sport],
+                }
+                for sport in self.sports
+            }
+
+    def interval_for(self, matchups, now=None, interval=None):
+        """Return how long to wait before refreshing a sport again.
+
+        Args:
+            matchups (list): The sport's matchups as returned by refresh.
+            now (datetime): The current time. Defaults to datetime.now().
+            interval (float): The sport's interval away from game time.
+                Defaults to the scheduler's interval.
+
+        Returns:
+            Float: At most game_interval if any game is within game_window of
+            its start time, otherwise interval.
+        """
+        now = now or datetime.now()
+        interval = self.interval if interval is None else interval
+        window = timedelta(seconds=self.game_window)
+        for matchup in matchups or []:
+            try:
+                start = datetime.fromisoformat(matchup["datetime"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            if abs(start - now) <= window:
+                return min(interval, self.game_interval)
+        return interval
+
+    def _adapt(self, sport, matchups):
+        # Caller holds the lock. Returns the sport's new adaptive interval.
+        fingerprint = odds_fingerprint(matchups)
+        previous = self._fingerprints.get(sport)
+        self._fingerprints[sport] = fingerprint
+        self._refreshes[sport] += 1
+        interval = self._adaptive_intervals[sport]
+        if previous is not None:
+            if fingerprint != previous:
+                self._changes[sport] += 1
+                interval = max(interval * self.SPEED_UP, self.min_interval)
+            else:
+                interval = min(interval * self.SLOW_DOWN, self.max_interval)
+        self._adaptive_intervals[sport] = interval
+        return interval
+
+    def _run(self):
+        while not self._stop.is_set():
+            now = time.monotonic()
+            with self._lock:
+                due = [sport for sport, due_at in self._next_due.items()
+                       if due_at <= now and sport not in self._running]
+                self._running.update(due)
+            for sport in due:
+                self._executor.submit(self._refresh, sport)
+
+            with self._lock:
+                waiting = [due_at for sport, due_at in self._next_due.items()
+                           if sport not in self._running]
+            timeout = min(waiting) - now if waiting else self.interval
+            self._wake.wait(max(timeout, 0.01))
+            self._wake.clear()
+
+    def _refresh(self, sport):
+        with self._lock:
+            interval = self._adaptive_intervals[sport]
+        try:
+            matchups = self._refresh_fn(sport)
+            with self._lock:
+                adaptive_interval = self._adapt(sport, matchups)
+            interval = self.interval_for(matchups, interval=adaptive_interval)
+        except Exception:
+            # Keep the current cadence and try again next time.
+            pass
+        finally:
+            with self._lock:
+                self._intervals[sport] = interval
+                self._next_due[sport] = time.monotonic() + interval
+                self._running.discard(sport)
+            self._wake.set()
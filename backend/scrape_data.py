@@ -1,9 +1,25 @@
-import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
+from bs4.element import Tag
+import soupsieve
+import html
 import json
-import betting_calculations as bc
-import sys
+import os
+import re
 from datetime import datetime
+from html.parser import HTMLParser
+import codecs
+import functools
+
+try:
+    import lexbor_tree
+except ImportError:
+    lexbor_tree = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # CSS class selectors for use by BS4.
 SELECTORS = {
@@ -21,77 +37,302 @@ SELECTORS = {
 # The sports available to scrape for.
 SPORTS = {"nba", "nhl", "ufc", "ncaab", "ncaaf", "nfl", "boxing"}
 
-def scrape_matchups(sport, matchup_containers, selectors):
+# Month names as they appear in the date bars.
+MONTHS = {
+    "January": 1,
+    "February": 2,
+    "March": 3,
+    "April": 4,
+    "May": 5,
+    "June": 6,
+    "July": 7,
+    "August": 8,
+    "September": 9,
+    "October": 10,
+    "November": 11,
+    "December": 12,
+}
+
+# The only page regions the scrape functions read. Everything else on the page
+# (navigation, ads, scripts) is skipped while the tree is built.
+PAGE_REGIONS = ("sportsbooks", "matchups", "gamedates", "odds")
+
+
+def region_strainer(selectors):
+    """Returns a SoupStrainer that keeps only the PAGE_REGIONS containers.
+
+    The first class of each region's selector identifies its container, e.g.
+    '.op-book-header img' keeps every .op-book-header along with its images.
+    Kept containers end up as siblings in document order, so a matchup's
+    previous_sibling is still the date bar (or matchup) right above it.
+
+    Args:
+        selectors (dict): CSS class selectors for use by BS4.
+
+    Returns:
+        SoupStrainer: Strainer to pass as BeautifulSoup's parse_only.
+    """
+    classes = [re.match(r'\.?([\w-]+)', selectors[region]).group(1)
+               for region in PAGE_REGIONS]
+    # A regex matches a single class of a multi-valued class attribute.
+    pattern = r'(^|\s)(' + '|'.join(map(re.escape, classes)) + r')(\s|$)'
+    return SoupStrainer(class_=re.compile(pattern))
+
+
+PAGE_STRAINER = region_strainer(SELECTORS)
+
+
+def region_selector(selectors):
+    """Returns the selector group that finds the sportsbook images, date bars,
+    matchup containers and odds containers in one walk over the page.
+    """
+    return ", ".join([
+        selectors["sportsbooks"],
+        "." + selectors["matchups"],
+        "." + selectors["gamedates"],
+        selectors["odds"],
+    ])
+
+
+class SelectorPlan(dict):
+    """A selectors dict with its CSS selectors compiled once, up front.
+
+    It is still the dict of selector strings, so it can be passed wherever
+    SELECTORS is; select() then hands BeautifulSoup trees the compiled
+    soupsieve pattern instead of having the string compiled (or looked up in
+    soupsieve's cache) on every call. Other trees, like lexbor's, get the
+    string. Don't modify a plan after creating it.
+    """
+
+    # Selectors used with select(), as opposed to class names used with find().
+    CSS_SELECTORS = ("sportsbooks", "odds", "team_1_odds", "team_2_odds")
+
+    def __init__(self, selectors):
+        """
+        Args:
+            selectors (dict): CSS class selectors for use by BS4.
+        """
+        super().__init__(selectors)
+        self._css = {name: self[name] for name in self.CSS_SELECTORS}
+        self._css["regions"] = region_selector(self)
+        self._compiled = {name: soupsieve.compile(css) for name, css in self._css.items()}
+
+    def select(self, element, name):
+        """Returns the elements under element matching the named selector.
+
+        Args:
+            element (Tag or LexborTag): Where to search.
+            name (string): One of CSS_SELECTORS, or "regions" for the
+                region_selector() group.
+        """
+        if isinstance(element, Tag):
+            return element.select(self._compiled[name])
+        return element.select(self._css[name])
+
+
+# SELECTORS compiled once, for the scrape pipeline.
+SELECTOR_PLAN = SelectorPlan(SELECTORS)
+
+
+def select(element, selectors, name):
+    """Returns element.select() of the named selector (see SelectorPlan.select),
+    using the precompiled pattern if selectors is a SelectorPlan.
+    """
+    if isinstance(selectors, SelectorPlan):
+        return selectors.select(element, name)
+    css = region_selector(selectors) if name == "regions" else selectors[name]
+    return element.select(css)
+
+# Parsers that can build the page tree. "lexbor" is selectolax behind a
+# bs4-compatible wrapper, and "lxml" and "html.parser" are BeautifulSoup tree
+# builders, fastest first. "scan" doesn't build a tree at all but scans the
+# raw HTML for the elements the scrape reads (see ScannedPage); it relies on
+# assumptions about the markup, so it is only used when asked for.
+PARSERS = ("lexbor", "lxml", "html.parser", "scan")
+
+
+def available_parsers():
+    """Returns the parsers in PARSERS whose dependencies are installed."""
+    available = []
+    for parser in PARSERS:
+        if parser == "lexbor":
+            if lexbor_tree is not None:
+                available.append(parser)
+        elif parser == "scan":
+            available.append(parser)
+        elif builder_registry.lookup(parser) is not None:
+            available.append(parser)
+    return available
+
+
+# The parser used to build page trees; override with OMNIBET_HTML_PARSER.
+HTML_PARSER = os.environ.get('OMNIBET_HTML_PARSER') or next(
+    parser for parser in available_parsers() if parser != "scan")
+
+
+# JSON libraries that can decode the data-op-* attributes, fastest first.
+JSON_BACKENDS = ("orjson", "json")
+
+
+def available_json_backends():
+    """Returns the JSON libraries in JSON_BACKENDS that are installed."""
+    return [backend for backend in JSON_BACKENDS
+            if backend == "json" or (backend == "orjson" and orjson is not None)]
+
+
+def make_attribute_decoder(backend, cache_size=4096):
+    """Returns a function that decodes a data-op-* attribute's JSON.
+
+    A page repeats the same attribute strings many times (the same odds at
+    several sportsbooks, the same team on every line), so decoded values are
+    memoized by their raw string. They are shared between callers and must
+    not be modified; copy them first.
+
+    Args:
+        backend (string): One of JSON_BACKENDS.
+        cache_size (int): How many distinct strings to remember, or 0 to
+            decode every string afresh.
+
+    Returns:
+        Callable: Takes the raw attribute string and returns its value.
+    """
+    if backend == "orjson":
+        if orjson is None:
+            raise ValueError("The orjson backend requires orjson to be installed.")
+        loads = orjson.loads
+    elif backend == "json":
+        loads = json.loads
+    else:
+        raise ValueError(f"Unknown JSON backend: {backend}")
+    if cache_size == 0:
+        return loads
+    return functools.lru_cache(maxsize=cache_size)(loads)
+
+
+# The JSON library used for the data-op-* attributes; override with
+# OMNIBET_JSON_BACKEND.
+JSON_BACKEND = os.environ.get('OMNIBET_JSON_BACKEND') or available_json_backends()[0]
+
+decode_attribute = make_attribute_decoder(JSON_BACKEND)
+
+
+def parse_html(content, parser=None, strainer=PAGE_STRAINER):
+    """Builds a tree for an HTML page that the scrape functions can walk.
+
+    Every parser produces a tree with the same find, find_all, select and
+    attribute interface, so the scrape functions give identical output
+    whichever one is used.
+
+    BeautifulSoup parsers only build the subtrees kept by the strainer. The
+    lexbor parser always builds the full tree, which is cheap in C. The scan
+    parser builds no tree; its page can only be passed to scrape_page().
+
+    Args:
+        content (bytes): The raw HTML of the page.
+        parser (string): One of PARSERS. Defaults to HTML_PARSER.
+        strainer (SoupStrainer): Containers to keep, or None for the whole page.
+
+    Returns:
+        BeautifulSoup, LexborTag or ScannedPage: The root of the page tree.
+    """
+    parser = parser or HTML_PARSER
+    if parser == "scan":
+        return ScannedPage(content)
+    if parser == "lexbor":
+        if lexbor_tree is None:
+            raise ValueError("The lexbor parser requires selectolax to be installed.")
+        return lexbor_tree.parse(content)
+    return BeautifulSoup(content, parser, parse_only=strainer)
+
+
+def scrape_matchups(sport, matchup_containers, selectors, today=None):
     """Creates list of JSON object for each matchup in the container.
 
     Args:
         sport (string): The sport on oddsshark.com to scrape odds for.
         matchup_containers (list): Holds the matchup containers on webpage.
         selectors (dict): CSS class selectors for use by BS4.
+        today (date): The day the page was scraped. Defaults to today.
 
     Returns:
         List: JSON object for each matchup.
     """
+    today = today or datetime.today().date()
     matchups = []
     for matchup_container in matchup_containers:
         container_above = matchup_container.previous_sibling
         is_date_new = selectors["gamedates"] in container_above['class']
         if is_date_new:
-            # date
-            raw_date = json.loads(container_above['data-op-date'])["full_date"].split()
-            month_string = raw_date[1]
-            day_string = raw_date[2]
-            month_to_integer = {
-            "January": 1,
-            "February": 2,
-            "March": 3, 
-            "April": 4,
-            "May": 5,
-            "June": 6,
-            "July": 7,
-            "August": 8,
-            "September": 9,
-            "October": 10,
-            "November": 11,
-            "December": 12,
-            }
-            month = month_to_integer[month_string]
-            day = int(day_string)
-            year = datetime.today().year
-            
-            date = [year, month, day]
-
-            
+            date = scrape_game_date(container_above, today)
 
         matchup = create_matchup_dict(matchup_container, sport, date, selectors)
         matchups.append(matchup)
     return matchups
 
 
-def create_matchup_dict(matchup_container, sport, date, selectors):
-    """Creates a dictionary for a match's information.
+def scrape_game_date(date_container, today=None):
+    """Get the game date from a date separator bar.
 
     Args:
-        matchup_container (NavigableString): The HTML for a single matchup.
-        sport (string): The sport on oddsshark.com to scrape odds for.
-        date (list): [year, month, day] where elements are integers.
-        selectors (dict): CSS class selectors for use by BS4.
+        date_container (NavigableString): The date bar above a day's matchups.
+        today (date): The day the page was scraped. Defaults to today.
 
     Returns:
-        Dict: The sport, date, time, and team information for the matchup.
+        Tuple: (year, month, day) where elements are integers.
     """
-    # Get team 1's data from data attribute and add logo.
-    team_1_container = matchup_container.find('div', class_= selectors["team_1_info"])
-    team_1 = json.loads(team_1_container['data-op-name'])
-    team_1["logo"] = f"../../../img/{sport}-logos/{team_1['full_name']}.png"
+    return parse_game_date(date_container['data-op-date'], today)
 
-    # Get team 2's data from data attribute and add logo.
-    team_2_container = matchup_container.find('div', class_= selectors["team_2_info"])
-    team_2 = json.loads(team_2_container['data-op-name'])
-    team_2["logo"] = f"../../../img/{sport}-logos/{team_2['full_name']}.png"
 
-    # Get the time
-    raw_time = matchup_container.find('div', class_= selectors["gametimes"]).get_text()
+def parse_game_date(raw_date_json, today=None):
+    """Get the game date from a date bar's data-op-date attribute.
+
+    The bars leave out the year, so the game is taken to be on the date
+    closest to today: January games listed in late December are next year's,
+    and December games still listed in early January last year's.
+
+    Args:
+        raw_date_json (string): JSON holding the date, e.g.
+            '{"full_date": "Saturday January 8", ...}'.
+        today (date): The day the page was scraped. Defaults to today.
+
+    Returns:
+        Tuple: (year, month, day) where elements are integers.
+    """
+    today = today or datetime.today().date()
+    return _game_date(decode_attribute(raw_date_json)["full_date"], today)
+
+
+@functools.lru_cache(maxsize=1024)
+def _game_date(full_date, today):
+    raw_date = full_date.split()
+    month = MONTHS[raw_date[1]]
+    day = int(raw_date[2])
+
+    closest = None
+    for year in (today.year - 1, today.year, today.year + 1):
+        try:
+            candidate = datetime(year, month, day).date()
+        except ValueError:
+            # February 29th outside a leap year.
+            continue
+        if closest is None or abs(candidate - today) < abs(closest - today):
+            closest = candidate
+    if closest is None:
+        raise ValueError(f'Invalid game date: {full_date}')
+    return (closest.year, month, day)
+
+
+@functools.lru_cache(maxsize=4096)
+def game_datetime(date, raw_time):
+    """Get the start of a game as a string.
+
+    Args:
+        date (tuple): (year, month, day) where elements are integers.
+        raw_time (string): The game time, e.g. "7:00p".
+
+    Returns:
+        String: The start of the game, e.g. "2022-01-08 19:00:00".
+    """
     is_pm = raw_time[-1] == "p"
     time = raw_time[:-1].split(":")
     hour = int(time[0])
@@ -100,14 +341,55 @@ def create_matchup_dict(matchup_container, sport, date, selectors):
         if hour == 24:
             hour = 12
     minute = int(time[1])
-   
+
     # Create datetime object using date and time
-    date_time = datetime(date[0], date[1], date[2], hour, minute)
+    return str(datetime(date[0], date[1], date[2], hour, minute))
+
+
+def create_matchup_dict(matchup_container, sport, date, selectors):
+    """Creates a dictionary for a match's information.
+
+    Args:
+        matchup_container (NavigableString): The HTML for a single matchup.
+        sport (string): The sport on oddsshark.com to scrape odds for.
+        date (tuple): (year, month, day) where elements are integers.
+        selectors (dict): CSS class selectors for use by BS4.
+
+    Returns:
+        Dict: The sport, date, time, and team information for the matchup.
+    """
+    team_1_container = matchup_container.find('div', class_= selectors["team_1_info"])
+    team_2_container = matchup_container.find('div', class_= selectors["team_2_info"])
+    raw_time = matchup_container.find('div', class_= selectors["gametimes"]).get_text()
+    return build_matchup(sport, date, raw_time, team_1_container['data-op-name'],
+                         team_2_container['data-op-name'])
+
+
+def build_matchup(sport, date, raw_time, raw_team_1_json, raw_team_2_json):
+    """Creates a dictionary for a match's information from its raw values.
+
+    Args:
+        sport (string): The sport on oddsshark.com to scrape odds for.
+        date (tuple): (year, month, day) where elements are integers.
+        raw_time (string): The game time, e.g. "7:00p".
+        raw_team_1_json (string): Team 1's data-op-name attribute.
+        raw_team_2_json (string): Team 2's data-op-name attribute.
+
+    Returns:
+        Dict: The sport, date, time, and team information for the matchup.
+    """
+    # Get team 1's data from data attribute and add logo.
+    team_1 = dict(decode_attribute(raw_team_1_json))
+    team_1["logo"] = f"../../../img/{sport}-logos/{team_1['full_name']}.png"
+
+    # Get team 2's data from data attribute and add logo.
+    team_2 = dict(decode_attribute(raw_team_2_json))
+    team_2["logo"] = f"../../../img/{sport}-logos/{team_2['full_name']}.png"
 
     # Create the object to return
     match_data = {
         "sport": sport,
-        "datetime": str(date_time),
+        "datetime": game_datetime(tuple(date), raw_time),
         "team_1": team_1,
         "team_2": team_2
     }
@@ -126,28 +408,41 @@ def scrape_odds(odds_container, sportsbooks, selectors):
     Returns:
         List: JSON objects for each matchup's odds.
     """
-    matchup_odds = {}
-    
     # There is specific HTML container for a game without any odds.
     matchup_has_no_odds = 'no-odds-wrapper' in odds_container['class']
     if matchup_has_no_odds:
+        return build_odds(sportsbooks, True, [], [])
+
+    # Scrape team 1's odds
+    t1_containers = select(odds_container, selectors, "team_1_odds")
+    t1_odds = [scrape_odds_from_container(container) for container in t1_containers]
+
+    # Scrape team 2's odds
+    t2_containers = select(odds_container, selectors, "team_2_odds")
+    t2_odds = [scrape_odds_from_container(container) for container in t2_containers]
+    return build_odds(sportsbooks, False, t1_odds, t2_odds)
+
+
+def build_odds(sportsbooks, no_odds, t1_odds, t2_odds):
+    """Pairs each team's odds with the sportsbooks offering them.
+
+    Args:
+        sportsbooks (list): Name for each sportsbook offering odds.
+        no_odds (bool): Whether the game has no odds at all.
+        t1_odds (list): Team 1's odds, in sportsbook order.
+        t2_odds (list): Team 2's odds, in sportsbook order.
+
+    Returns:
+        Dict: Each team's odds keyed by sportsbook.
+    """
+    matchup_odds = {}
+    if no_odds:
         empty_odds = {sportsbooks[i]: None for i in range(len(sportsbooks))}
         matchup_odds["team_1"] = empty_odds
         matchup_odds["team_2"] = empty_odds
     else:
-        
-        # Scrape team 1's odds
-        t1_containers = odds_container.select(selectors["team_1_odds"])
-        # print(t1_containers)
-        t1_odds = [scrape_odds_from_container(container) for container in t1_containers]
-        # print(t1_odds)
         matchup_odds["team_1"] = {sportsbooks[i]: t1_odds[i] for i in range(len(sportsbooks))}
-        
-        # Scrape team 2's odds
-        t2_containers = odds_container.select(selectors["team_2_odds"])
-        t2_odds = [scrape_odds_from_container(container) for container in t2_containers]
         matchup_odds["team_2"] = {sportsbooks[i]: t2_odds[i] for i in range(len(sportsbooks))}
-    
     return matchup_odds
 
 
@@ -160,7 +455,16 @@ def scrape_odds_from_container(odds_container):
     Returns:
         Integer or None: Integer odd value if it exists, otherwise None.
     """
-    odds = json.loads(odds_container['data-op-moneyline'])
+    return parse_moneyline(odds_container['data-op-moneyline'])
+
+
+def parse_moneyline(raw_moneyline_json):
+    """Get the full game odds from an odd's data-op-moneyline attribute.
+
+    Returns:
+        Integer or None: Integer odd value if it exists, otherwise None.
+    """
+    odds = decode_attribute(raw_moneyline_json)
     if odds['fullgame'] != "":
         return int(odds['fullgame'])
     else:
@@ -168,77 +472,384 @@ def scrape_odds_from_container(odds_container):
 
 
 def scrape_sportsbook_names(page_bs4, selectors):
-    sportsbook_images = page_bs4.select(selectors["sportsbooks"])
+    sportsbook_images = select(page_bs4, selectors, "sportsbooks")
     names = [image["alt"].lower().strip() for image in sportsbook_images]
     return names
 
 
-def scrape_data_for(sport):
-    # Send request using Proxy to bypass content restriction due to IP location. 
-    # Handle exceptions by returning "fake" i.e. old data.
-    url = f'https://www.oddsshark.com/{sport}/odds'
-    proxies = {
-        "http": "http://52.183.8.192:3128", # Florida
-        "https": "http://52.183.8.192:3128", # Florida
-    }
-    try:
-        http_response = requests.get(url, proxies=proxies)
-        http_response.raise_for_status()  
-    except requests.exceptions.HTTPError as err_http:
-        return bc.get_fake_data(sport)
-    except requests.exceptions.ConnectionError as err_conn:
-        return bc.get_fake_data(sport)
-    except requests.exceptions.Timeout as err_time:
-        return bc.get_fake_data(sport)
-    except requests.exceptions.ProxyError as err_proxy:
-        return bc.get_fake_data(sport)
-    else:
-        page_bs4 =  BeautifulSoup(http_response.content, 'html.parser')
-    
-    # Scrape sportsbook names
-    sportsbook_names = scrape_sportsbook_names(page_bs4, SELECTORS)
-
-    # Scrape the left-hand containers holding matchup info only.
-    matchup_containers = page_bs4.find_all('div', class_= SELECTORS["matchups"])
-    matchups = scrape_matchups(sport, matchup_containers, SELECTORS)
-
-    # Find all the game odds containers and create odds dict for each one.
-    odds_containers = page_bs4.select(SELECTORS["odds"])
-    odds = []
-    for container in odds_containers:
-        odds.append(scrape_odds(container, sportsbook_names, SELECTORS))
-    
-    # Check that every matchup has a corresponding odds dict.
-    is_scraped_correctly = len(matchups) == len(odds)
-
-    if is_scraped_correctly:
-        try:
-            current_matchup = 0
-            for matchup in matchups:
-                for team in ["team_1", "team_2"]:
-                    # Add each team's odds dict to the matchup dict.
-                    team_odds = odds[current_matchup][team]
-                    matchup[team]["odds"] = team_odds
-
-                    # Add betting metrics to the matchup dict.
-                    max_profit_odd = bc.optimal_odd_to_bet(team_odds)
-                    matchup[team]["money_multiplier"] = bc.money_multiplier(max_profit_odd)
-                    matchup[team]["win_probability"] = bc.win_probability_from_odds(team_odds)
-            
-                current_matchup += 1
-            return matchups
-        except:
-            return bc.get_fake_data(sport)
-    else:
-        return bc.get_fake_data(sport)
+def scrape_page(sport, page_bs4, selectors, today=None):
+    """Scrapes sportsbooks, matchups and odds in one walk over the page.
 
+    A single selector group finds the sportsbook images, date bars, matchup
+    containers and odds containers in document order. Each matchup takes the
+    date of the latest date bar above it and is paired with the odds
+    container in the same position, as the left and right columns of the page
+    list games in the same order.
+
+    Args:
+        sport (string): The sport on oddsshark.com to scrape odds for.
+        page_bs4 (BeautifulSoup): The parsed page.
+        selectors (dict): CSS class selectors for use by BS4, ideally a
+            SelectorPlan so they aren't compiled again for every page.
+        today (date): The day the page was scraped, which every game date on
+            it is read relative to. Defaults to today.
+
+    Returns:
+        Tuple: (sportsbook names, list of (matchup dict, odds dict) pairs).
+
+    Raises:
+        ValueError: If the page doesn't have one odds container per matchup.
+    """
+    today = today or datetime.today().date()
+    if isinstance(page_bs4, ScannedPage):
+        return page_bs4.scrape(sport, selectors, today)
+    if isinstance(page_bs4, OddsExtractor):
+        return page_bs4.result()
+
+    sportsbook_names = []
+    matchups = []
+    odds_containers = []
+    date_container = None
+    for element in select(page_bs4, selectors, "regions"):
+        if element.name == 'img':
+            sportsbook_names.append(element["alt"].lower().strip())
+            continue
+        classes = element['class']
+        if selectors["gamedates"] in classes:
+            date_container = element
+        elif selectors["matchups"] in classes:
+            # Only parse a date bar once the first matchup below it shows up.
+            if date_container is not None:
+                date = scrape_game_date(date_container, today)
+                date_container = None
+            matchups.append(create_matchup_dict(element, sport, date, selectors))
+        else:
+            odds_containers.append(element)
+
+    # Sportsbook headers sit above every odds container, so all names are
+    # known by the time the odds are scraped.
+    check_odds_count(matchups, odds_containers)
+    rows = pair_odds(matchups, odds_containers,
+                     lambda container: scrape_odds(container, sportsbook_names, selectors))
+    return sportsbook_names, rows
+
+
+def pair_odds(matchups, odds_items, to_odds, rows=None):
+    """Pairs the matchups with the odds in the same position, as far as both
+    lists go.
+
+    Args:
+        matchups (list): Matchup dicts in page order.
+        odds_items (list): Whatever to_odds turns into odds, in page order.
+        to_odds (callable): Turns an item of odds_items into an odds dict.
+        rows (list): Pairs already made, which are kept and continued from.
+
+    Returns:
+        List: (matchup dict, odds dict) pairs.
+    """
+    rows = rows if rows is not None else []
+    for i in range(len(rows), min(len(matchups), len(odds_items))):
+        rows.append((matchups[i], to_odds(odds_items[i])))
+    return rows
+
+
+def check_odds_count(matchups, odds_items):
+    """Makes sure a page has exactly one odds container per matchup.
+
+    Nothing on the page ties an odds container to its matchup other than
+    their position, so if one is missing or extra every game after it would
+    get another game's odds. Such a page is rejected instead.
+
+    Raises:
+        ValueError: If the counts differ.
+    """
+    if len(matchups) != len(odds_items):
+        raise ValueError(f'Page has {len(matchups)} matchups but '
+                         f'{len(odds_items)} odds containers')
+
+
+def _css_classes(compound_selector):
+    """Returns the classes of a compound selector, e.g. {'a', 'b'} for '.a.b'."""
+    return {name for name in compound_selector.split('.') if name}
+
+
+class OddsExtractor:
+    """Scrapes an odds page from its elements, fed one at a time in document
+    order, without a page tree.
+
+    Call start_element() for every start tag, text() for the text that
+    follows it and end_element() for every end tag (optional; text stops
+    being collected at the next start tag either way). Only a few flags and
+    the matchup and odds row being read are kept, which is enough to produce
+    what scrape_page() produces for the same page. Each (matchup, odds) pair
+    is appended to `rows` as soon as both of its containers have been read,
+    i.e. once the next container of the same kind starts.
+    """
+
+    def __init__(self, sport, selectors=SELECTORS, today=None):
+        """
+        Args:
+            sport (string): The sport on oddsshark.com to scrape odds for.
+            selectors (dict): CSS class selectors for use by BS4.
+            today (date): The day the page was scraped. Defaults to today.
+        """
+        self.sport = sport
+        self.selectors = selectors
+        self.today = today or datetime.today().date()
+        book_header, self._book_tag = selectors["sportsbooks"].split()
+        self._book_header_classes = _css_classes(book_header)
+        self._odds_classes = _css_classes(selectors["odds"])
+        self._team_rows = []
+        for team in ["team_1", "team_2"]:
+            row, item = selectors[f"{team}_odds"].split()
+            self._team_rows.append((team, _css_classes(row), _css_classes(item)))
+
+        self.sportsbook_names = []
+        self.rows = []
+        self._matchups = []
+        self._odds_rows = []
+        self._in_book_header = False
+        self._date_bar = None
+        self._date = None
+        # Raw values of the matchup and the odds being read, if any.
+        self._matchup = None
+        self._odds_row = None
+        self._odds_team = None
+        self._reading_time = False
+
+    def start_element(self, tag, attrs):
+        """Reads a start tag.
+
+        Args:
+            tag (string): The lowercase tag name.
+            attrs (dict): The tag's attributes, with entities already decoded.
+        """
+        self._reading_time = False
+        if tag == self._book_tag:
+            if self._in_book_header:
+                self.sportsbook_names.append(attrs["alt"].lower().strip())
+                self._in_book_header = False
+            return
+
+        class_value = attrs.get("class")
+        if not class_value:
+            return
+        classes = class_value.split()
+        selectors = self.selectors
+        if self._book_header_classes.issubset(classes):
+            self._in_book_header = True
+        elif selectors["gamedates"] in classes:
+            self._date_bar = attrs
+        elif selectors["matchups"] in classes:
+            self._finish_matchup()
+            # Only parse a date bar once the first matchup below it shows up.
+            if self._date_bar is not None:
+                self._date = parse_game_date(self._date_bar["data-op-date"], self.today)
+                self._date_bar = None
+            self._matchup = {"date": self._date}
+        elif self._odds_classes.issubset(classes):
+            self._finish_matchup()
+            self._finish_odds_row()
+            self._odds_row = ('no-odds-wrapper' in classes, {"team_1": [], "team_2": []})
+            self._odds_team = None
+        elif self._odds_row is not None:
+            for team, row_classes, item_classes in self._team_rows:
+                if row_classes.issubset(classes):
+                    self._odds_team = team
+                elif team == self._odds_team and item_classes.issubset(classes):
+                    self._odds_row[1][team].append(attrs["data-op-moneyline"])
+        elif self._matchup is not None:
+            # Like find(), only the first of each is used.
+            if class_value == selectors["gametimes"] and "time" not in self._matchup:
+                self._matchup["time"] = []
+                self._reading_time = True
+            elif class_value == selectors["team_1_info"]:
+                self._matchup.setdefault("team_1", attrs["data-op-name"])
+            elif class_value == selectors["team_2_info"]:
+                self._matchup.setdefault("team_2", attrs["data-op-name"])
+
+    def text(self, data):
+        """Reads text following the last start tag."""
+        if self._reading_time:
+            self._matchup["time"].append(data)
+
+    def end_element(self, tag):
+        """Reads an end tag."""
+        self._reading_time = False
+
+    def result(self):
+        """Finishes the page.
+
+        Returns:
+            Tuple: (sportsbook names, list of (matchup dict, odds dict) pairs),
+            as returned by scrape_page().
+
+        Raises:
+            ValueError: If the page doesn't have one odds container per matchup.
+        """
+        self._finish_matchup()
+        self._finish_odds_row()
+        check_odds_count(self._matchups, self._odds_rows)
+        return self.sportsbook_names, self.rows
+
+    def _finish_matchup(self):
+        matchup, self._matchup = self._matchup, None
+        if matchup is None:
+            return
+        self._matchups.append(build_matchup(
+            self.sport, matchup["date"], "".join(matchup["time"]),
+            matchup["team_1"], matchup["team_2"]))
+        self._pair_ready()
+
+    def _finish_odds_row(self):
+        odds_row, self._odds_row = self._odds_row, None
+        if odds_row is None:
+            return
+        self._odds_rows.append(odds_row)
+        self._pair_ready()
+
+    def _pair_ready(self):
+        pair_odds(self._matchups, self._odds_rows, self._to_odds, self.rows)
+
+    def _to_odds(self, odds_row):
+        no_odds, moneylines = odds_row
+        t1_odds = [parse_moneyline(moneyline) for moneyline in moneylines["team_1"]]
+        t2_odds = [parse_moneyline(moneyline) for moneyline in moneylines["team_2"]]
+        return build_odds(self.sportsbook_names, no_odds, t1_odds, t2_odds)
+
+
+# Start tags of the elements ScannedPage looks at, with the text right after
+# them. As in the HTML tokenizer, a quote only starts a value right after an
+# '=', and quoted values are matched whole since they may contain '>'. The
+# attributes are matched as runs of plain characters separated by '=' or
+# '=' plus a quoted value, which can only split a tag one way. Neither
+# unquoted text nor a quoted value runs past the start of the next div or
+# img tag (unquoted text stops at any '<'), so a tag that never ends, e.g.
+# on a truncated page, is given up on at the next tag instead of being
+# rescanned to the end of the page. That keeps the whole scan linear.
+_SCAN_VALUE = r'{q}[^{q}<]*(?:<(?!(?:div|img)[\s/>])[^{q}<]*)*{q}'
+_SCAN_TAG = re.compile(
+    r'<(div|img)(?=[\s/>])'
+    r'([^<>=]*(?:(?:=\s*' + _SCAN_VALUE.format(q='"') + r'|=\s*' + _SCAN_VALUE.format(q="'")
+    + r'|=(?!\s*["\']))[^<>=]*)*)'
+    r'>([^<]*)',
+    re.IGNORECASE)
+_SCAN_ATTR = re.compile(r'([^\s"\'>/=]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'>]+))')
+
+
+def _unescape(value):
+    if '&' not in value:
+        return value
+    # The JSON attributes only ever escape their quotes; html.unescape() is
+    # several times slower, so it is left for anything else.
+    unquoted = value.replace('&quot;', '"')
+    return unquoted if '&' not in unquoted else html.unescape(value)
+
+
+def scan_elements(text):
+    """Yields the (tag, attrs, text) of every div and img start tag that can
+    matter to OddsExtractor, in document order, found by a regex scan.
+    """
+    for match in _SCAN_TAG.finditer(text):
+        tag, raw_attrs, following_text = match.groups()
+        tag = tag.lower()
+        # Every div the scrape reads has an "op-" class.
+        if tag == 'div' and 'op-' not in raw_attrs:
+            continue
+        attrs = {}
+        for name, double_quoted, single_quoted, unquoted in _SCAN_ATTR.findall(raw_attrs):
+            attrs.setdefault(name.lower(),
+                             _unescape(double_quoted or single_quoted or unquoted))
+        yield tag, attrs, _unescape(following_text)
+
+
+class ScannedPage:
+    """A page "parsed" by the scan parser: the elements the scrape reads,
+    found with a linear regex scan over the raw HTML instead of a tree.
+
+    The scan assumes well-formed markup, i.e. no div or img tags spelled out
+    in scripts or comments. That has only been checked against the synthetic
+    pages in tests/pages, not against live oddsshark.com pages, so the scan
+    parser is never picked by default.
+    """
+
+    def __init__(self, content):
+        """
+        Args:
+            content (bytes): The raw HTML of the page.
+        """
+        if isinstance(content, bytes):
+            content = content.decode('utf-8', errors='replace')
+        self.elements = list(scan_elements(content))
+
+    def scrape(self, sport, selectors, today=None):
+        """Scrapes the page; see scrape_page()."""
+        extractor = OddsExtractor(sport, selectors, today)
+        for tag, attrs, text in self.elements:
+            extractor.start_element(tag, attrs)
+            if text:
+                extractor.text(text)
+        return extractor.result()
+
+
+class StreamingPageParser(HTMLParser):
+    """Incremental HTML tokenizer that feeds an OddsExtractor.
+
+    The page can be fed in chunks as it downloads; only the incomplete tag at
+    the end of a chunk is buffered, and rows appear in extractor.rows as soon
+    as their containers have been read.
+    """
+
+    def __init__(self, sport, selectors=SELECTORS, today=None):
+        """
+        Args:
+            sport (string): The sport on oddsshark.com to scrape odds for.
+            selectors (dict): CSS class selectors for use by BS4.
+            today (date): The day the page was scraped. Defaults to today.
+        """
+        super().__init__()
+        self.extractor = OddsExtractor(sport, selectors, today)
+        self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+    def feed_bytes(self, chunk):
+        """Feeds a chunk of the raw page, which may end mid-character."""
+        self.feed(self._decoder.decode(chunk))
+
+    def close(self):
+        self.feed(self._decoder.decode(b'', final=True))
+        super().close()
+
+    def handle_starttag(self, tag, attrs):
+        # Like BeautifulSoup, keep the first of repeated attributes.
+        attr_dict = {}
+        for name, value in attrs:
+            attr_dict.setdefault(name, value if value is not None else '')
+        self.extractor.start_element(tag, attr_dict)
+
+    def handle_endtag(self, tag):
+        self.extractor.end_element(tag)
+
+    def handle_data(self, data):
+        self.extractor.text(data)
+
+
+def scrape_stream(sport, chunks, selectors=SELECTORS, deadline=None):
+    """Scrapes a page from its raw chunks while they are still arriving.
+
+    Args:
+        sport (string): The sport on oddsshark.com to scrape odds for.
+        chunks (iterable): The page's bytes, e.g. from Response.iter_content().
+        selectors (dict): CSS class selectors for use by BS4.
+        deadline (Deadline): If given, checked before every chunk is read.
+
+    Returns:
+        OddsExtractor: The fed extractor, to pass to scrape_page() as the page.
+    """
+    parser = StreamingPageParser(sport, selectors)
+    for chunk in chunks:
+        parser.feed_bytes(chunk)
+        if deadline is not None:
+            deadline.check("reading the rest of the page")
+    parser.close()
+    return parser.extractor
 
-# Scrape for given sport by running 'python scrape_data.py sport' in cmd.
-if __name__ == '__main__':
-    valid_sport = sys.argv[1] in {'nba', 'nhl', 'ufc', 'ncaab', 'ncaaf',
-    'nfl', 'boxing'}
-    
-    if valid_sport:
-        print(json.dumps(scrape_data_for(sys.argv[1]), indent=4))
-    else:
-        print(f'{sys.argv[1]} is not a supported argument. Try another.')
\ No newline at end of file
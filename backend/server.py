@@ -3,9 +3,15 @@ from flask import Flask, request, jsonify, abort
 from flask_cors import CORS
 import scrape_data as scraper
 import requests
-from bs4 import BeautifulSoup
 import betting_calculations as bc
+import http_client
+import pipeline
+from cache import OddsCache
+from scheduler import RefreshScheduler
+from snapshots import SNAPSHOT_DIR, SnapshotStore
+from concurrent.futures import Future, ThreadPoolExecutor
 import json
+import os
 
 # Initialize the Flask application.
 app = Flask(__name__)
@@ -13,9 +19,88 @@ app = Flask(__name__)
 # Configure indentation for JSON response.
 app.config['JSONIFY_PRETTYPRINT_REGULAR'] = True
 
+# Seconds scraped odds are served from memory before they go stale, and how
+# much longer stale odds may be served while a background refresh runs.
+app.config['ODDS_CACHE_TTL'] = float(os.environ.get('OMNIBET_CACHE_TTL', 60))
+app.config['ODDS_CACHE_STALE_TTL'] = float(
+    os.environ.get('OMNIBET_CACHE_STALE_TTL', 300))
+
+# Background re-scraping of every sport, so requests are served from the
+# cache instead of waiting on oddsshark.com. Sports start out refreshed every
+# REFRESH_INTERVAL seconds, then adapt between REFRESH_MIN_INTERVAL and
+# REFRESH_MAX_INTERVAL to how often their odds change. While one of their
+# games is within REFRESH_GAME_WINDOW seconds of its start time they are
+# refreshed at least every REFRESH_GAME_INTERVAL seconds.
+app.config['REFRESH_SCHEDULER'] = os.environ.get('OMNIBET_REFRESH_SCHEDULER') == '1'
+app.config['REFRESH_INTERVAL'] = float(os.environ.get('OMNIBET_REFRESH_INTERVAL', 55))
+app.config['REFRESH_MIN_INTERVAL'] = float(
+    os.environ.get('OMNIBET_REFRESH_MIN_INTERVAL', 15))
+app.config['REFRESH_MAX_INTERVAL'] = float(
+    os.environ.get('OMNIBET_REFRESH_MAX_INTERVAL', 300))
+app.config['REFRESH_GAME_INTERVAL'] = float(
+    os.environ.get('OMNIBET_REFRESH_GAME_INTERVAL', 20))
+app.config['REFRESH_GAME_WINDOW'] = float(
+    os.environ.get('OMNIBET_REFRESH_GAME_WINDOW', 3600))
+
+# Where the last successful scrape of each sport is kept.
+app.config['SNAPSHOT_DIR'] = SNAPSHOT_DIR
+
 # Add support for cross-origin requests.
 CORS(app)
 
+
+def cache_ttl(sport):
+    """Seconds a sport's cached matchups stay fresh, or None for ODDS_CACHE_TTL.
+
+    While the refresh scheduler runs it owns the refreshes, so an entry stays
+    fresh for the sport's current refresh interval. Otherwise stale reads
+    would re-scrape slow-moving sports every ODDS_CACHE_TTL seconds anyway.
+    """
+    if refresh_scheduler.running():
+        return refresh_scheduler.intervals().get(sport)
+    return None
+
+
+# Per-sport cache of finished matchup lists.
+odds_cache = OddsCache(app.config['ODDS_CACHE_TTL'],
+                       app.config['ODDS_CACHE_STALE_TTL'],
+                       ttl_for=cache_ttl)
+
+# Last-known-good matchups for each sport, served when scraping fails. On
+# startup they are read back from disk and also seed the cache, so a restarted
+# server can answer (as STALE, while refreshing) without waiting on a scrape.
+snapshot_store = SnapshotStore(app.config['SNAPSHOT_DIR'])
+for sport in snapshot_store.load(scraper.SPORTS):
+    odds_cache.put(sport, snapshot_store.get(sport), age=snapshot_store.age(sport))
+
+# Worker threads used to scrape several sports at once for the bulk endpoint.
+scrape_executor = ThreadPoolExecutor(max_workers=len(scraper.SPORTS))
+
+# Worker threads of the refresh scheduler. They are kept apart from
+# scrape_executor so background refreshes never hold up user requests.
+refresh_executor = ThreadPoolExecutor(max_workers=len(scraper.SPORTS))
+
+# How long each stage of the scrape pipeline takes, for /api/metrics.
+stage_timings = pipeline.StageTimings()
+pipeline.add_stage_hook(stage_timings.record)
+
+
+def refresh_sport(sport):
+    """Scrape a sport and store the result in the cache."""
+    return odds_cache.refresh(sport, scrape_odds_for)
+
+
+refresh_scheduler = RefreshScheduler(
+    scraper.SPORTS, refresh_sport,
+    interval=app.config['REFRESH_INTERVAL'],
+    game_interval=app.config['REFRESH_GAME_INTERVAL'],
+    game_window=app.config['REFRESH_GAME_WINDOW'],
+    executor=refresh_executor,
+    min_interval=app.config['REFRESH_MIN_INTERVAL'],
+    max_interval=app.config['REFRESH_MAX_INTERVAL'])
+if app.config['REFRESH_SCHEDULER']:
+    refresh_scheduler.start()
+
 # Error handling
 @app.errorhandler(HTTPError)
 @app.errorhandler(404)
@@ -43,14 +128,15 @@ def proxy_exception_handler(error):
 
     In the event of an error with the Proxy being used, our solution is to
     simply return the data from the most recent, successful response for the 
-    given sport. The sport causing the error is passed into the description 
-    parameter (second positional argument) of the abort() method. 
+    given sport, which is held in memory by the snapshot store. The sport
+    causing the error is passed into the description parameter (second
+    positional argument) of the abort() method. 
     
     We override the status code here to 203 in order to "trick" the front-end 
     promise into thinking that the fetch was successful.
     """
     sport_causing_err = error.description
-    placeholder_response = bc.get_fake_data(sport_causing_err)
+    placeholder_response = fallback_matchups(sport_causing_err)
     return jsonify(placeholder_response), 203
 
 
@@ -64,92 +150,157 @@ def unhandled_exception_handler(error):
     We override the status code here to 203 in order to "trick" the front-end 
     promise into thinking that the fetch was successful.
     """
-    sport_causing_err = error.description
-    placeholder_response = bc.get_fake_data(sport_causing_err)
+    # Only errors raised with abort(code, sport) carry the sport.
+    sport_causing_err = getattr(error, 'description', None)
+    placeholder_response = fallback_matchups(sport_causing_err)
     return jsonify(placeholder_response), 203
 
 
-# Endpoint
+# Endpoints
+@app.route("/api/odds", methods=['GET'])
+def get_odds_for_sports():
+    """Endpoint to return sports gambling info for several sports at once.
+
+    The sports are given as a comma separated query parameter, e.g.
+    /api/odds?sports=nba,nhl, and default to every sport in scraper.SPORTS.
+    Sports in the cache are answered right away; the ones that have to be
+    scraped are scraped concurrently, so the response takes as long as the
+    slowest of them. A sport that fails to scrape contributes its placeholder
+    data instead of failing the request.
+
+    The X-Cache header lists the cache status of each sport, e.g.
+    "nba=HIT, nhl=MISS".
+
+    Returns:
+        List: JSON object holding information for each matchup of every sport.
+    """
+    requested = request.args.get('sports', '')
+    sports = [sport.strip() for sport in requested.split(',') if sport.strip()]
+    if not sports:
+        sports = sorted(scraper.SPORTS)
+
+    # Catch invalid sport arguments before scraping anything.
+    for sport in sports:
+        if sport not in scraper.SPORTS:
+            abort(404, sport)
+
+    # Only cache misses take up a worker.
+    lookups = {}
+    for sport in sports:
+        if sport not in lookups:
+            cached = odds_cache.lookup(sport, scrape_odds_for)
+            if cached is None:
+                cached = scrape_executor.submit(odds_cache.get, sport, scrape_odds_for)
+            lookups[sport] = cached
+
+    all_matchups = []
+    cache_statuses = []
+    for sport in sports:
+        try:
+            cached = lookups[sport]
+            if isinstance(cached, Future):
+                cached = cached.result()
+            matchups, cache_status, _ = cached
+        except Exception:
+            matchups, cache_status = fallback_matchups(sport), 'ERROR'
+        all_matchups.extend(matchups)
+        cache_statuses.append(f'{sport}={cache_status}')
+
+    response = jsonify(all_matchups)
+    response.headers['X-Cache'] = ', '.join(cache_statuses)
+    return response
+
+
+@app.route("/api/metrics", methods=['GET'])
+def get_metrics():
+    """Endpoint to return runtime metrics for the scraping backend.
+
+    Returns:
+        Dict: JSON object holding the metrics of each backend component.
+    """
+    return jsonify({
+        "http": http_client.connection_stats(),
+        "proxies": http_client.proxy_pool.stats(),
+        "circuit_breakers": http_client.circuit_stats(),
+        "rate_limit": http_client.rate_limiter.stats(),
+        "pipeline": stage_timings.snapshot(),
+        "deadline_misses": pipeline.deadline_misses(),
+        "refresh": refresh_scheduler.stats(),
+    })
+
+
 @app.route("/api/odds/<sport>", methods=['GET'])
 def get_odds_for_sport(sport):
-    """Endpoint to scrape oddsshark.com and return sports gambling info in JSON.
+    """Endpoint to return sports gambling info from oddsshark.com in JSON.
+
+    Matchups are served from the in-process cache when possible. The
+    X-Cache header reports HIT, STALE or MISS and the Age header reports how
+    many seconds ago the matchups were scraped.
 
-    The sportsbooks offering odds sit in their own container.
-    Matchup data (team names, game date and time) sits in its own container.
-    Odds data sits in its own container.
-    
-    For simplicity, this scrapes each container independently and then
-    'weaves' all 3 pieces of information together to get the final output.
-    
     Args:
         sport (string): The name of the sport to scrape info for.
-    
+
     Returns:
         List: JSON object holding information for each matchup.
     """
-    selectors = scraper.SELECTORS
-    
-    # Catch invalid sport argument before even sending request.
+    # Catch invalid sport argument before even checking the cache.
     if sport not in scraper.SPORTS:
         abort(404, sport)
 
-    # Send request using Proxy to bypass content restriction due to IP location. 
-    url = f'https://www.oddsshark.com/{sport}/odds'
-    proxies = {
-        "http": "http://52.183.8.192:3128", # Florida
-        "https": "http://52.183.8.192:3128", # Florida
-    }
+    matchups, cache_status, age = odds_cache.get(sport, scrape_odds_for)
+    response = jsonify(matchups)
+    response.headers['X-Cache'] = cache_status
+    response.headers['Age'] = str(int(age))
+    return response
+
+
+def fallback_matchups(sport):
+    """Return the matchups to serve for a sport whose scrape failed.
+
+    The most recent successful scrape is preferred. Sports that have never
+    been scraped successfully fall back to the placeholder data.
+
+    Args:
+        sport (string): The name of the sport that failed to scrape.
+
+    Returns:
+        List: Dict holding information for each matchup, empty if the sport
+        has neither a snapshot nor placeholder data.
+    """
+    matchups = snapshot_store.get(sport)
+    if matchups is not None:
+        return matchups
+    try:
+        return bc.get_fake_data(sport)
+    except KeyError:
+        return []
+
+
+def scrape_odds_for(sport):
+    """Scrape oddsshark.com for a sport's matchups and betting metrics.
+
+    Runs the shared scrape pipeline and maps its failures onto the error
+    handlers above. Successful scrapes are saved to the snapshot store.
+
+    Args:
+        sport (string): The name of the sport to scrape info for.
     
-    # Catch various exceptions and handle using functions above. Otherwise,
-    # instantiate BS4 object to continue scraping.
+    Returns:
+        List: Dict holding information for each matchup.
+    """
     try:
-        http_response = requests.get(url, proxies=proxies)
-        http_response.raise_for_status()  
+        matchups = pipeline.run(sport)
     except (requests.exceptions.ConnectionError, requests.exceptions.ProxyError, 
     requests.exceptions.Timeout) as err_proxy:
         abort(500, sport) # invoke proxy_error_handler
     except (requests.exceptions.HTTPError) as err_http:
         abort(404, sport) # invoke route_not_found_handler
+    except http_client.RateLimited:
+        # Upstream is being asked too often; serve the last snapshot instead.
+        abort(503, sport) # invoke unhandled_exception_handler
     except:
+        # Error in scraping or "weaving" matchups and odds.
         abort(500, sport) # invoke unhandled_exception_handler
     else:
-        page_bs4 = BeautifulSoup(http_response.content, 'html.parser')
-    
-    # Scrape sportsbook names
-    sportsbook_names = scraper.scrape_sportsbook_names(page_bs4, selectors)
-    
-    # Scrape the left-hand containers holding matchup info only.
-    matchup_containers = page_bs4.find_all('div', class_= selectors["matchups"])
-    matchups = scraper.scrape_matchups(sport, matchup_containers, selectors)
-
-    # Find all the game odds containers and create odds dict for each one.
-    odds_containers = page_bs4.select(selectors["odds"])
-    odds = []
-    for container in odds_containers:
-        odds.append(scraper.scrape_odds(container, sportsbook_names, selectors))
-    
-    # Scraping correct if every matchup has a corresponding odds dict.
-    is_scraped_correctly = len(matchups) == len(odds)
-
-    if is_scraped_correctly:
-        try:
-            current_matchup = 0
-            for matchup in matchups:
-                for team in ["team_1", "team_2"]:
-                    # Add each team's odds dict to the matchup dict.
-                    team_odds = odds[current_matchup][team]
-                    matchup[team]["odds"] = team_odds
-
-                    # Add betting metrics to the matchup dict.
-                    max_profit_odd = bc.optimal_odd_to_bet(team_odds)
-                    matchup[team]["money_multiplier"] = bc.money_multiplier(max_profit_odd)
-                    matchup[team]["win_probability"] = bc.win_probability_from_odds(team_odds)
-            
-                current_matchup += 1
-            return jsonify(matchups)
-        except:
-            # Error in "zipping" matchups and odds.
-            abort(500, sport)
-    else:
-        # Scraping of odds was done incorrectly.
-        abort(500, sport)
\ No newline at end of file
+        snapshot_store.save(sport, matchups)
+        return matchups
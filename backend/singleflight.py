@@ -0,0 +1,63 @@
+import threading
+
+
+class _Call:
+    """An in-flight call whose result is shared by every waiting caller."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Coalesce concurrent calls for the same key into one execution.
+
+    The first caller for a key runs the function. Callers that arrive while it
+    is still running block until it finishes and receive the same result (or
+    the same exception) instead of running the function again.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn, *args):
+        """Run fn(*args) once for all concurrent callers using the same key.
+
+        Args:
+            key (hashable): Identifies calls that can share a result.
+            fn (callable): The function to run.
+
+        Returns:
+            Whatever fn returns. Exceptions raised by fn are re-raised in
+            every caller.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args)
+            return call.result
+        except BaseException as err:
+            call.error = err
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def in_flight(self, key):
+        """Return True if a call for the key is currently running."""
+        with self._lock:
+            return key in self._calls
@@ -0,0 +1,84 @@
+import json
+import os
+import tempfile
+import threading
+import time
+
+# Directory the last successful scrape of each sport is saved to; override
+# with OMNIBET_SNAPSHOT_DIR.
+SNAPSHOT_DIR = os.environ.get('OMNIBET_SNAPSHOT_DIR') or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'snapshots')
+
+
+class SnapshotStore:
+    """Last-known-good matchups for each sport, kept in memory and on disk.
+
+    Every successful scrape is saved with save(). Reads only ever touch
+    memory; the files are there so a restarted server can warm up with
+    load() instead of going to the network.
+    """
+
+    def __init__(self, directory=SNAPSHOT_DIR):
+        """
+        Args:
+            directory (string): Where to keep one <sport>.json per sport.
+        """
+        self.directory = directory
+        self._snapshots = {}
+        self._lock = threading.Lock()
+
+    def save(self, sport, matchups):
+        """Remember a sport's matchups and write them to disk.
+
+        The file is written to a temporary name and then renamed, so a crash
+        mid-write never leaves a truncated snapshot behind.
+        """
+        snapshot = {"saved_at": time.time(), "matchups": matchups}
+        with self._lock:
+            self._snapshots[sport] = snapshot
+
+        os.makedirs(self.directory, exist_ok=True)
+        file_descriptor, temp_path = tempfile.mkstemp(
+            dir=self.directory, prefix=f'.{sport}.', suffix='.tmp')
+        try:
+            with os.fdopen(file_descriptor, 'w') as snapshot_file:
+                json.dump(snapshot, snapshot_file)
+            os.replace(temp_path, self._path(sport))
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def get(self, sport):
+        """Return the most recent matchups saved for a sport, or None."""
+        with self._lock:
+            snapshot = self._snapshots.get(sport)
+        return snapshot["matchups"] if snapshot else None
+
+    def age(self, sport):
+        """Return how many seconds ago a sport was saved, or None."""
+        with self._lock:
+            snapshot = self._snapshots.get(sport)
+        return time.time() - snapshot["saved_at"] if snapshot else None
+
+    def load(self, sports):
+        """Read the snapshots of the given sports from disk into memory.
+
+        Missing or unreadable files are skipped.
+
+        Returns:
+            List: The sports a snapshot was loaded for.
+        """
+        loaded = []
+        for sport in sports:
+            try:
+                with open(self._path(sport)) as snapshot_file:
+                    snapshot = json.load(snapshot_file)
+            except (OSError, ValueError):
+                continue
+            with self._lock:
+                self._snapshots[sport] = snapshot
+            loaded.append(sport)
+        return loaded
+
+    def _path(self, sport):
+        return os.path.join(self.directory, f'{sport}.json')
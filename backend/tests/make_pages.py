@@ -0,0 +1,176 @@
+import html
+import json
+import os
+import random
+from datetime import datetime
+import betting_calculations as bc
+
+# TO RUN, be at backend as current directory.  Run python -m tests.make_pages
+#
+# Writes the synthetic odds pages in tests/pages. They are not captures of
+# oddsshark.com: each one lays out a sport's placeholder matchups in the
+# oddsshark markup the scraper's SELECTORS expect, padded with made-up
+# navigation, script and ad markup so the scrape has something to skip.
+# ncaab gets randomly generated games, seeded so the output is reproducible.
+# Parser timings measured on these pages compare the parsers with each other;
+# they aren't representative of the live site.
+
+PAGES_DIR = os.path.join(os.path.dirname(__file__), 'pages')
+
+SPORTS = ["nba", "nhl", "ufc", "ncaab", "ncaaf", "nfl", "boxing"]
+
+BOOK_ALTS = {"opening": "Opening", "betonline": "BetOnline", "bodog": "Bodog", "bumbet": "BUMBet",
+             "caesars": "Caesars", "intertops": "Intertops", "mirage": "Mirage", "mybookie": "MyBookie",
+             "station": "Station", "westgate": "Westgate", "wynn": "Wynn", "bovada": "Bovada"}
+
+SCHOOLS = ["Duke", "Kentucky", "Kansas", "Gonzaga", "Baylor", "Purdue", "Arizona", "Auburn", "Houston",
+           "Villanova", "UCLA", "Texas Tech", "Tennessee", "Illinois", "Wisconsin", "Iowa State",
+           "Michigan State", "Ohio State", "Alabama", "Arkansas", "LSU", "Xavier", "Providence",
+           "Marquette", "Seton Hall", "Creighton", "Indiana", "Iowa", "Michigan", "Maryland",
+           "Virginia", "North Carolina", "Miami", "Florida", "Texas", "Oklahoma", "TCU",
+           "West Virginia", "Kansas State", "Oregon", "USC", "Colorado", "Utah", "Stanford",
+           "Memphis", "Cincinnati", "SMU", "Wichita State", "BYU", "Saint Mary's",
+           "San Diego State", "Boise State", "Wyoming", "Colorado State", "Nevada", "UNLV",
+           "Loyola Chicago", "Davidson", "Dayton", "VCU", "Richmond", "Murray State",
+           "Belmont", "Vermont", "Iona", "Chattanooga", "Furman", "Wofford", "Drake",
+           "Northern Iowa", "Missouri State", "Bradley", "Toledo", "Akron", "Ohio",
+           "Kent State", "Buffalo", "Ball State", "Marshall", "Charlotte", "UAB", "Louisiana Tech",
+           "North Texas", "Rice", "New Mexico", "Fresno State", "Utah State", "Air Force",
+           "Georgia", "Mississippi State", "Ole Miss", "Vanderbilt", "South Carolina",
+           "Missouri", "Texas A&M", "Georgetown", "DePaul", "Butler", "St. John's", "UConn",
+           "Rutgers", "Penn State", "Minnesota", "Nebraska", "Northwestern", "Clemson"]
+
+
+def attr(obj):
+    """Encode a value as a data-op-* attribute value."""
+    return html.escape(json.dumps(obj), quote=True)
+
+
+def ncaab_games():
+    """Random ncaab matchups; the last game has no odds at all."""
+    schools = list(SCHOOLS)
+    random.shuffle(schools)
+    books = ["opening", "betonline", "bodog", "bumbet", "caesars", "mirage", "mybookie", "westgate"]
+    games = []
+    for i in range(0, 104, 2):
+        day = 15 + i // 40
+        hour = random.choice([12, 14, 16, 18, 19, 20, 21])
+        minute = random.choice([0, 0, 30])
+        fav = random.randint(-900, -105)
+        dog = random.randint(100, 700)
+        games.append({
+            "datetime": str(datetime(2022, 1, day, hour, minute)),
+            "sport": "ncaab",
+            "team_1": {"full_name": schools[i], "short_name": "", "odds": {
+                b: (None if random.random() < .1 else fav + random.randint(-15, 15)) for b in books}},
+            "team_2": {"full_name": schools[i + 1], "short_name": "", "odds": {
+                b: (None if random.random() < .1 else dog + random.randint(-15, 15)) for b in books}},
+        })
+    games[-1]["team_1"]["odds"] = {b: None for b in books}
+    games[-1]["team_2"]["odds"] = {b: None for b in books}
+    return games
+
+
+def time_text(dt):
+    """Format a game time the way oddsshark does, e.g. 7:30p."""
+    h, m = dt.hour, dt.minute
+    suffix = "p" if h >= 12 else "a"
+    h12 = h - 12 if h > 12 else (12 if h == 0 else h)
+    return f"{h12}:{m:02d}{suffix}"
+
+
+def filler():
+    """Navigation, script and ad markup that the scrape has to skip."""
+    nav = "".join(f'<li class="menu-item"><a href="/section/{i}" class="menu-link">Section {i} News &amp; Picks</a></li>'
+                  for i in range(250))
+    script = ("<script>window.dataLayer=window.dataLayer||[];"
+              + ";".join(f"dataLayer.push({{'event':'e{i}','value':{i}}})" for i in range(300))
+              + "</script>")
+    ads = "".join(f'<div class="ad-slot" id="ad-{i}"><iframe src="https://ads.example.com/{i}" width="300" height="250"></iframe>'
+                  f'<p class="ad-copy">Sponsored content {i} with some marketing text that nobody reads.</p></div>'
+                  for i in range(40))
+    return nav, script, ads
+
+
+def page(sport, games):
+    """Lay out the games as an odds page.
+
+    Args:
+        sport (string): The sport the page is for.
+        games (list): Matchup dicts, as returned by bc.get_fake_data().
+
+    Returns:
+        String: The page's HTML.
+    """
+    books = list(games[0]["team_1"]["odds"])
+    if "opening" in books:
+        books.remove("opening")
+        books.insert(0, "opening")
+    nav, script, ads = filler()
+    out = ['<!DOCTYPE html><html lang="en"><head><meta charset="utf-8"><title>', sport.upper(), ' Odds | Odds Shark</title>',
+           '<link rel="stylesheet" href="/static/site.css">', script, '</head><body>',
+           '<header class="site-header"><nav class="main-nav"><ul>', nav, '</ul></nav></header>',
+           '<main class="odds-page"><div class="op-top-ads">', ads[:len(ads)//2], '</div>',
+           '<div class="op-content-wrapper"><div class="op-book-header-wrapper">']
+    for b in books:
+        out.append(f'<div class="op-book-header"><a href="/sportsbooks/{b}"><img src="/img/{b}.png" alt=" {BOOK_ALTS[b]} "></a></div>')
+
+    # Left column: date bars and matchups.
+    out.append('</div><div class="op-left-column">')
+    last_date = None
+    for g in games:
+        dt = datetime.fromisoformat(g["datetime"])
+        d = dt.date()
+        if d != last_date:
+            full = dt.strftime("%A %B ") + str(dt.day)
+            date_json = attr({"full_date": full, "short_date": dt.strftime("%a %b %d")})
+            out.append(f'<div class="op-separator-bar" data-op-date="{date_json}"><span class="op-date">{full}</span></div>')
+            last_date = d
+        out.append(f'<div class="op-matchup-wrapper {sport}"><div class="op-matchup-time op-matchup-text">{time_text(dt)}</div>')
+        for pos, key in (("top", "team_1"), ("bottom", "team_2")):
+            t = g[key]
+            name_json = attr({"full_name": t["full_name"], "short_name": t["short_name"]})
+            name = html.escape(t["full_name"])
+            out.append(f'<div class="op-matchup-team op-matchup-text op-team-{pos}" data-op-name="{name_json}"><a href="/teams/{name}">{name}</a></div>')
+        out.append('</div>')
+
+    # Right column: an odds row per matchup, in the same order.
+    out.append('</div><div class="op-right-column">')
+    last_date = None
+    for g in games:
+        dt = datetime.fromisoformat(g["datetime"])
+        if dt.date() != last_date:
+            out.append('<div class="op-separator-bar op-right"></div>')
+            last_date = dt.date()
+        no_odds = (all(v is None for v in g["team_1"]["odds"].values())
+                   and all(v is None for v in g["team_2"]["odds"].values()))
+        if no_odds:
+            out.append('<div class="op-item-row-wrapper not-futures no-odds-wrapper"><div class="no-odds">Odds not available</div></div>')
+            continue
+        out.append('<div class="op-item-row-wrapper not-futures">')
+        for row, key in (("op-first-row", "team_1"), ("op-second-row", "team_2")):
+            out.append(f'<div class="op-item-row {row}">')
+            for b in books:
+                v = g[key]["odds"].get(b)
+                ml = "" if v is None else (f"+{v}" if v > 0 else str(v))
+                spread = {"fullgame": ml, "firsthalf": "", "secondhalf": ""}
+                out.append(f'<div class="op-item op-spread" data-op-moneyline="{attr(spread)}" '
+                           f'data-op-total="{attr({"fullgame": "o210.5"})}"><span class="op-odds">{ml}</span></div>')
+            out.append('</div>')
+        out.append('</div>')
+    out.append('</div></div>')
+    out.append('<div class="op-bottom-ads">' + ads[len(ads)//2:] + '</div></main>')
+    out.append('<footer class="site-footer"><ul>' + nav + '</ul></footer>' + script + '</body></html>')
+    return "".join(out)
+
+
+def main(pages_dir=PAGES_DIR):
+    random.seed(7)
+    for sport in SPORTS:
+        games = ncaab_games() if sport == "ncaab" else bc.get_fake_data(sport)
+        with open(os.path.join(pages_dir, f'{sport}.html'), 'w') as page_file:
+            page_file.write(page(sport, games))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+import asyncio
+import tempfile
+import time
+import unittest
+from unittest import mock
+import async_pipeline
+import pipeline
+from snapshots import SnapshotStore
+from test_pipeline import page_response
+
+
+FETCH_SECONDS = 0.5
+
+
+def slow_fetch(url, conditional, deadline, **kwargs):
+    time.sleep(FETCH_SECONDS)
+    return page_response(url.split('/')[-2])
+
+
+class TestAsyncPipeline(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        patcher = mock.patch.object(async_pipeline, 'SnapshotStore',
+                                    lambda: SnapshotStore(self.temp_dir.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @mock.patch('http_client.fetch', side_effect=slow_fetch)
+    def test_sports_are_fetched_concurrently(self, _):
+        sports = async_pipeline.scraper.SPORTS
+        start = time.monotonic()
+        results = async_pipeline.scrape_all(sports)
+        # About one fetch's time for all of them, even where the event loop's
+        # default executor has fewer threads than there are sports.
+        self.assertLess(time.monotonic() - start, 1.5 * FETCH_SECONDS)
+        self.assertEqual(sorted(results), sorted(sports))
+
+    @mock.patch('http_client.fetch', side_effect=lambda url, **_: page_response('nhl'))
+    def test_same_output_as_sync_pipeline(self, _):
+        self.assertEqual(asyncio.run(async_pipeline.run('nhl')), pipeline.run('nhl'))
+
+    @mock.patch('http_client.fetch', side_effect=ConnectionError())
+    def test_failed_scrape_falls_back(self, _):
+        results = async_pipeline.scrape_all(['nba'])
+        self.assertEqual(results['nba'], async_pipeline.pipeline.bc.get_fake_data('nba'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,5 @@
+import hashlib
+import json
 import unittest
 import requests
 from bs4 import BeautifulSoup
@@ -67,6 +69,37 @@ class TestBettingCalculations(unittest.TestCase):
         # Odd is None
         self.assertAlmostEqual(bc.money_multiplier(None), None)
 
+    def test_get_fake_data(self):
+        matchups = bc.get_fake_data("nba")
+        self.assertEqual(matchups[0]["sport"], "nba")
+
+        # Loaded once, then served from memory.
+        self.assertIs(bc.get_fake_data("nba"), matchups)
+
+        # Sport without placeholder data
+        with self.assertRaises(KeyError):
+            bc.get_fake_data("foosball")
+
+    def test_fake_data_matches_original_literal(self):
+        # Matchup count and SHA-256 of the sorted-key JSON of each sport's data
+        # in the dict literal that fallback_data/ replaced.
+        original = {
+            "nba": (17, "27439a6bd39484c9d74b32082648de05ef3f3266230dc30bfecbee37d468e8be"),
+            "nhl": (13, "a8478181923eb4bbde8dfc6b37bc8e55e0ede033ac80ec233aebf4ab6e95819d"),
+            "ufc": (26, "8dd8da055587dfc4f7a6de8fb33aff20295500ffa545d1142b2a64dff1122f1f"),
+            "ncaab": (98, "6d653cafe9da49591eb2ff4fe022741c2bb484da155e399b6272e50272fca689"),
+            "ncaaf": (1, "7848166bba4f32cb259ea599d1d37e68e049e33a3fdce6053c26c071ddad7b80"),
+            "nfl": (14, "a22c029d9ab95b984d88fe12953fbc5bc34426f9b752149e4dea8c5a57dfa7ba"),
+            "boxing": (2, "3cf8e04f1455a31d08ed75f904587a4bfe5986e50249c2b9e2ab87963e45e69f"),
+        }
+        self.assertEqual(set(original), scraper.SPORTS)
+        for sport, (count, digest) in original.items():
+            with self.subTest(sport=sport):
+                matchups = bc.get_fake_data(sport)
+                self.assertEqual(len(matchups), count)
+                encoded = json.dumps(matchups, sort_keys=True).encode()
+                self.assertEqual(hashlib.sha256(encoded).hexdigest(), digest)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
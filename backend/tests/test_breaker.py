@@ -0,0 +1,57 @@
+import unittest
+import requests
+from breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def fail_calls(self, breaker, times):
+        for _ in range(times):
+            breaker.before_call()
+            breaker.record_failure()
+
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker("odds", failure_threshold=3, reset_timeout=60)
+        self.fail_calls(breaker, 2)
+        breaker.before_call()
+        breaker.record_success()
+        self.fail_calls(breaker, 2)
+        self.assertEqual(breaker.stats()["state"], CLOSED)
+
+        self.fail_calls(breaker, 1)
+        self.assertEqual(breaker.stats()["state"], OPEN)
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_call()
+        self.assertEqual(breaker.stats()["short_circuits"], 1)
+
+    def test_open_circuit_is_a_connection_error(self):
+        self.assertTrue(issubclass(CircuitOpenError, requests.exceptions.ConnectionError))
+
+    def test_half_open_lets_a_single_probe_through(self):
+        breaker = CircuitBreaker("odds", failure_threshold=1, reset_timeout=0)
+        self.fail_calls(breaker, 1)
+
+        breaker.before_call()
+        self.assertEqual(breaker.stats()["state"], HALF_OPEN)
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_call()
+
+        breaker.record_success()
+        self.assertEqual(breaker.stats()["state"], CLOSED)
+        breaker.before_call()
+
+    def test_failed_probe_reopens(self):
+        breaker = CircuitBreaker("odds", failure_threshold=5, reset_timeout=0)
+        self.fail_calls(breaker, 5)
+        self.fail_calls(breaker, 1)
+        self.assertEqual(breaker.stats()["state"], OPEN)
+
+    def test_release_gives_back_the_probe(self):
+        breaker = CircuitBreaker("odds", failure_threshold=1, reset_timeout=0)
+        self.fail_calls(breaker, 1)
+        breaker.before_call()
+        breaker.release()
+        breaker.before_call()
+
+
+if __name__ == '__main__':
+    unittest.main()
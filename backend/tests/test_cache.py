@@ -0,0 +1,68 @@
+import threading
+import unittest
+from cache import OddsCache, HIT, STALE, MISS
+
+
+class TestOddsCache(unittest.TestCase):
+    def test_miss_then_hit(self):
+        cache = OddsCache(ttl=60, stale_ttl=60)
+        calls = []
+        loader = lambda sport: calls.append(sport) or [sport]
+
+        self.assertEqual(cache.get("nba", loader), (["nba"], MISS, 0.0))
+        matchups, status, _ = cache.get("nba", loader)
+        self.assertEqual((matchups, status), (["nba"], HIT))
+        self.assertEqual(calls, ["nba"])
+
+    def test_stale_entry_served_while_refreshing(self):
+        cache = OddsCache(ttl=10, stale_ttl=60)
+        cache.put("nhl", ["old"], age=30)
+        refreshed = threading.Event()
+
+        def loader(sport):
+            refreshed.set()
+            return ["new"]
+
+        matchups, status, age = cache.get("nhl", loader)
+        self.assertEqual((matchups, status), (["old"], STALE))
+        self.assertGreaterEqual(age, 30)
+        self.assertTrue(refreshed.wait(5))
+
+    def test_expired_entry_is_a_miss(self):
+        cache = OddsCache(ttl=10, stale_ttl=10)
+        cache.put("ufc", ["old"], age=30)
+        self.assertEqual(cache.get("ufc", lambda sport: ["new"]),
+                         (["new"], MISS, 0.0))
+
+    def test_lookup_never_loads(self):
+        cache = OddsCache(ttl=10, stale_ttl=10)
+        loader = lambda sport: self.fail("lookup() loaded " + sport)
+        self.assertIsNone(cache.lookup("nba", loader))
+
+        cache.put("nba", ["old"], age=30)
+        self.assertIsNone(cache.lookup("nba", loader))
+
+        cache.put("nba", ["new"])
+        matchups, status, _ = cache.lookup("nba", loader)
+        self.assertEqual((matchups, status), (["new"], HIT))
+
+    def test_ttl_for_overrides_ttl_per_sport(self):
+        cache = OddsCache(ttl=10, stale_ttl=10, ttl_for={"boxing": 300}.get)
+        loader = lambda sport: [sport]
+        cache.put("boxing", ["old"], age=120)
+        cache.put("nba", ["old"], age=120)
+        self.assertEqual(cache.get("boxing", loader)[:2], (["old"], HIT))
+        self.assertEqual(cache.get("nba", loader)[:2], (["nba"], MISS))
+
+    def test_loader_error_propagates_on_miss(self):
+        cache = OddsCache(ttl=10, stale_ttl=10)
+
+        def loader(sport):
+            raise RuntimeError(sport)
+
+        with self.assertRaises(RuntimeError):
+            cache.get("nfl", loader)
+
+
+if __name__ == '__main__':
+    unittest.main()
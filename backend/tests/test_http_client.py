@@ -0,0 +1,293 @@
+import http.server
+import socket
+import threading
+import time
+import unittest
+import requests
+from concurrent.futures import Future
+from unittest import mock
+import http_client
+from breaker import CircuitBreaker, CircuitOpenError
+from deadline import Deadline, DeadlineExceeded
+from proxies import ProxyPool
+from ratelimit import RateLimiter
+
+_unlimited = mock.patch.object(http_client, 'rate_limiter', RateLimiter(0, 0, 0, 0))
+
+
+def setUpModule():
+    # Keep the fetches made here independent of the shared token buckets.
+    _unlimited.start()
+
+
+def tearDownModule():
+    _unlimited.stop()
+
+
+class _KeepAliveHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        if self.headers.get('If-None-Match') == '"v1"':
+            self.send_response(304)
+            self.send_header('ETag', '"v1"')
+            self.end_headers()
+            return
+        body = b'<html></html>'
+        self.send_response(200)
+        self.send_header('ETag', '"v1"')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestPooledFetch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _KeepAliveHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.url = f'http://127.0.0.1:{cls.server.server_port}/nba/odds'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_repeated_fetches_reuse_connection(self):
+        before = http_client.connection_stats()
+        for _ in range(3):
+            self.assertEqual(http_client.fetch(self.url, proxies={}).status_code, 200)
+
+        # A different thread shares the same pools.
+        thread = threading.Thread(target=http_client.fetch, args=(self.url,),
+                                  kwargs={'proxies': {}})
+        thread.start()
+        thread.join(5)
+
+        after = http_client.connection_stats()
+        self.assertEqual(after["requests"] - before["requests"], 4)
+        self.assertEqual(after["connections_opened"] - before["connections_opened"], 1)
+
+
+class TestConditionalFetch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # A server of its own, so its connection isn't counted by TestPooledFetch.
+        cls.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _KeepAliveHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.url = f'http://127.0.0.1:{cls.server.server_port}/nhl/odds'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_conditional_fetch_returns_not_modified(self):
+        # Nothing remembered yet, so the request is unconditional.
+        first = http_client.fetch(self.url, proxies={}, conditional=True)
+        self.assertFalse(http_client.is_not_modified(first))
+        http_client.remember_payload(self.url, first, ['parsed'])
+
+        second = http_client.fetch(self.url, proxies={}, conditional=True)
+        self.assertTrue(http_client.is_not_modified(second))
+        self.assertEqual(http_client.previous_payload(self.url), ['parsed'])
+
+
+class _SlowProxyHandler(_KeepAliveHandler):
+    def do_GET(self):
+        time.sleep(1)
+        super().do_GET()
+
+
+class TestFetchDeadline(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _SlowProxyHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.url = f'http://127.0.0.1:{cls.server.server_port}/nba/odds'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_request_timeout_is_capped_by_deadline(self):
+        start = time.monotonic()
+        with self.assertRaises(requests.exceptions.Timeout):
+            http_client.fetch(self.url, proxies={}, deadline=Deadline(0.2))
+        self.assertLess(time.monotonic() - start, 0.9)
+
+    def test_expired_deadline_sends_nothing(self):
+        before = http_client.connection_stats()["requests"]
+        with self.assertRaises(DeadlineExceeded):
+            http_client.fetch(self.url, proxies={}, deadline=Deadline(0))
+        self.assertEqual(http_client.connection_stats()["requests"], before)
+
+
+class _TricklingHandler(_KeepAliveHandler):
+    def do_GET(self):
+        body = b'<html>' + b' ' * 17 + b'</html>'
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        delay = 0.1 if self.path == '/slow' else 0
+        for i in range(len(body)):
+            self.wfile.write(body[i:i + 1])
+            self.wfile.flush()
+            time.sleep(delay)
+
+
+class TestBodyDeadline(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _TricklingHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.url = f'http://127.0.0.1:{cls.server.server_port}'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_trickling_body_is_cut_off_at_deadline(self):
+        start = time.monotonic()
+        with self.assertRaises(DeadlineExceeded):
+            http_client.fetch(self.url + '/slow', proxies={}, deadline=Deadline(0.5))
+        self.assertLess(time.monotonic() - start, 1)
+
+    def test_body_read_under_deadline_reuses_connection(self):
+        before = http_client.connection_stats()
+        for _ in range(2):
+            http_response = http_client.fetch(self.url + '/fast', proxies={},
+                                              deadline=Deadline(5))
+            self.assertEqual(http_response.content, b'<html>' + b' ' * 17 + b'</html>')
+        after = http_client.connection_stats()
+        self.assertEqual(after["connections_opened"] - before["connections_opened"], 1)
+
+
+class TestHedgedFetch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Plain HTTP servers answer absolute-form proxy requests themselves,
+        # so they stand in for a slow and a fast proxy.
+        cls.servers = [http.server.ThreadingHTTPServer(('127.0.0.1', 0), handler)
+                       for handler in (_SlowProxyHandler, _KeepAliveHandler)]
+        for server in cls.servers:
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+        cls.slow, cls.fast = [f'http://127.0.0.1:{server.server_port}'
+                              for server in cls.servers]
+
+    @classmethod
+    def tearDownClass(cls):
+        for server in cls.servers:
+            server.shutdown()
+            server.server_close()
+
+    def test_slow_proxy_is_hedged_by_another(self):
+        pool = ProxyPool([self.slow, self.fast])
+        before = http_client.connection_stats()
+        with mock.patch.object(http_client, 'proxy_pool', pool), \
+                mock.patch.object(http_client, 'HEDGE_REQUESTS', True), \
+                mock.patch.object(http_client, 'HEDGE_DEFAULT_DELAY', 0.05):
+            start = time.perf_counter()
+            http_response = http_client.fetch('http://oddsshark.invalid/nba/odds')
+            elapsed = time.perf_counter() - start
+
+        after = http_client.connection_stats()
+        self.assertEqual(http_response.status_code, 200)
+        self.assertLess(elapsed, 0.9)
+        self.assertEqual(after["hedges"] - before["hedges"], 1)
+        self.assertEqual(after["hedge_wins"] - before["hedge_wins"], 1)
+
+    def test_retry_after_failed_proxy_is_not_a_hedge_win(self):
+        # Nothing listens on the port of a closed socket.
+        with socket.socket() as closed:
+            closed.bind(('127.0.0.1', 0))
+            dead = f'http://127.0.0.1:{closed.getsockname()[1]}'
+        pool = ProxyPool([dead, self.fast])
+        before = http_client.connection_stats()
+        with mock.patch.object(http_client, 'proxy_pool', pool), \
+                mock.patch.object(http_client, 'HEDGE_REQUESTS', True), \
+                mock.patch.object(http_client, 'HEDGE_DEFAULT_DELAY', 5):
+            http_response = http_client.fetch('http://oddsshark.invalid/nba/odds')
+
+        after = http_client.connection_stats()
+        self.assertEqual(http_response.status_code, 200)
+        self.assertEqual(after["hedges"] - before["hedges"], 0)
+        self.assertEqual(after["hedge_wins"] - before["hedge_wins"], 0)
+
+
+class TestBreakerAndRateLimit(unittest.TestCase):
+    URL = 'http://breaker.invalid/nba/odds'
+
+    def setUp(self):
+        # A limiter whose only token is already taken.
+        self.limiter = RateLimiter(0.01, 1, 0, 0)
+        self.limiter.acquire('breaker.invalid', 0)
+        self.breaker = CircuitBreaker('breaker.invalid', failure_threshold=1, reset_timeout=60)
+        for patcher in [mock.patch.object(http_client, 'rate_limiter', self.limiter),
+                        mock.patch.dict(http_client._breakers,
+                                        {'breaker.invalid': self.breaker})]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_open_circuit_fails_fast_without_taking_a_token(self):
+        self.breaker.before_call()
+        self.breaker.record_failure()
+
+        start = time.perf_counter()
+        for _ in range(3):
+            with self.assertRaises(CircuitOpenError):
+                http_client.fetch(self.URL, proxies={})
+        self.assertLess(time.perf_counter() - start, 0.1)
+        self.assertEqual(self.limiter.stats(), {"admitted": 1, "delayed": 0, "rejected": 0})
+
+    def test_rate_limited_probe_is_given_back(self):
+        self.breaker.before_call()
+        self.breaker.record_failure()
+        self.breaker.reset_timeout = 0
+
+        with self.assertRaises(http_client.RateLimited):
+            http_client.fetch(self.URL, proxies={}, deadline=Deadline(0.01))
+        # The half-open probe slot is free again.
+        self.breaker.before_call()
+
+
+class TestProxyProbes(unittest.TestCase):
+    PROBE = 'http://10.0.0.1:3128'
+    OTHER = 'http://10.0.0.2:3128'
+
+    def setUp(self):
+        # PROBE is ejected and due for a probe, OTHER is healthy.
+        self.pool = ProxyPool([self.PROBE, self.OTHER], cooldown=0)
+        self.pool.record_success(self.OTHER, 0.1)
+        for _ in range(4):
+            self.pool.record_failure(self.PROBE)
+        patcher = mock.patch.object(http_client, 'proxy_pool', self.pool)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_probe_without_a_result_is_given_back(self):
+        with mock.patch.object(http_client, '_get', side_effect=ValueError('bad request')):
+            with self.assertRaises(ValueError):
+                http_client.fetch('http://oddsshark.invalid/nba/odds')
+        self.assertEqual(self.pool.choose(), self.PROBE)
+
+    def test_probe_past_deadline_is_given_back(self):
+        self.assertEqual(self.pool.choose(), self.PROBE)
+        with self.assertRaises(DeadlineExceeded):
+            http_client._fetch_via(self.PROBE, 'http://oddsshark.invalid/nba/odds',
+                                   Deadline(0))
+        self.assertEqual(self.pool.choose(), self.PROBE)
+
+    def test_cancelled_hedge_gives_back_its_probe(self):
+        self.assertEqual(self.pool.choose(), self.PROBE)
+        http_client._cancel_all({Future(): self.PROBE})
+        self.assertEqual(self.pool.choose(), self.PROBE)
+
+
+if __name__ == '__main__':
+    unittest.main()
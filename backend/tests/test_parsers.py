@@ -0,0 +1,154 @@
+import os
+import re
+import time
+import unittest
+from unittest import mock
+import scrape_data as scraper
+
+# Synthetic odds pages written by make_pages.py, not captures of the live site.
+PAGES_DIR = os.path.join(os.path.dirname(__file__), 'pages')
+
+
+def load_page(sport):
+    with open(os.path.join(PAGES_DIR, f'{sport}.html'), 'rb') as page_file:
+        return page_file.read()
+
+
+def scrape_page_by_container(sport, content):
+    """Scrape the whole html.parser tree one kind of container at a time."""
+    selectors = scraper.SELECTORS
+    page = scraper.parse_html(content, 'html.parser', None)
+    sportsbook_names = scraper.scrape_sportsbook_names(page, selectors)
+    matchup_containers = page.find_all('div', class_=selectors["matchups"])
+    matchups = scraper.scrape_matchups(sport, matchup_containers, selectors)
+    odds = [scraper.scrape_odds(container, sportsbook_names, selectors)
+            for container in page.select(selectors["odds"])]
+    return sportsbook_names, list(zip(matchups, odds))
+
+
+class TestParserBackends(unittest.TestCase):
+    def test_every_parser_matches_original_scrape(self):
+        for sport in sorted(scraper.SPORTS):
+            content = load_page(sport)
+            baseline = scrape_page_by_container(sport, content)
+            for parser in scraper.available_parsers():
+                with self.subTest(sport=sport, parser=parser):
+                    page = scraper.parse_html(content, parser)
+                    self.assertEqual(scraper.scrape_page(sport, page, scraper.SELECTORS),
+                                     baseline)
+
+    def test_default_parser_is_available(self):
+        self.assertIn(scraper.HTML_PARSER, scraper.PARSERS)
+
+    def test_scan_parser_is_opt_in(self):
+        self.assertNotEqual(scraper.HTML_PARSER, 'scan')
+
+
+class TestSelectorPlan(unittest.TestCase):
+    def test_plan_matches_original_scrape(self):
+        for sport in sorted(scraper.SPORTS):
+            content = load_page(sport)
+            baseline = scrape_page_by_container(sport, content)
+            for parser in scraper.available_parsers():
+                with self.subTest(sport=sport, parser=parser):
+                    page = scraper.parse_html(content, parser)
+                    self.assertEqual(
+                        scraper.scrape_page(sport, page, scraper.SELECTOR_PLAN), baseline)
+
+    def test_plan_is_still_the_selectors_dict(self):
+        self.assertIsInstance(scraper.SELECTOR_PLAN, dict)
+        self.assertEqual(scraper.SELECTOR_PLAN, scraper.SELECTORS)
+
+
+class TestScrapePage(unittest.TestCase):
+    def assert_page_rejected(self, sport, content):
+        pages = {parser: lambda parser=parser: scraper.parse_html(content, parser)
+                 for parser in scraper.available_parsers()}
+        pages['streaming'] = lambda: scraper.scrape_stream(sport, [content])
+        for engine, parse in pages.items():
+            with self.subTest(engine=engine), self.assertRaises(ValueError):
+                scraper.scrape_page(sport, parse(), scraper.SELECTORS)
+
+    def test_missing_odds_container_rejects_the_page(self):
+        content = load_page('nba')
+        odds_starts = [match.start() for match in
+                       re.finditer(rb'<div class="op-item-row-wrapper', content)]
+        # Drop an odds container in the middle of the page and the last one.
+        for start, end in [odds_starts[3:5], (odds_starts[-1], content.rindex(b'</main>'))]:
+            self.assert_page_rejected('nba', content[:start] + content[end:])
+
+    def test_extra_odds_container_rejects_the_page(self):
+        content = load_page('nba')
+        start = content.index(b'<div class="op-item-row-wrapper')
+        end = content.index(b'<div class="op-item-row-wrapper', start + 1)
+        doubled = content[:end] + content[start:end] + content[end:]
+        self.assert_page_rejected('nba', doubled)
+
+
+class TestStreamingParser(unittest.TestCase):
+    def test_any_chunking_matches_original_scrape(self):
+        for sport in sorted(scraper.SPORTS):
+            content = load_page(sport)
+            baseline = scrape_page_by_container(sport, content)
+            for size in [7, 4096]:
+                with self.subTest(sport=sport, chunk_size=size):
+                    chunks = (content[i:i + size] for i in range(0, len(content), size))
+                    page = scraper.scrape_stream(sport, chunks)
+                    self.assertEqual(scraper.scrape_page(sport, page, scraper.SELECTORS),
+                                     baseline)
+
+    def test_rows_are_emitted_before_the_page_ends(self):
+        content = load_page('nhl')
+        # Stop right after the second odds row of the page starts.
+        first = content.index(b'class="op-item-row-wrapper not-futures')
+        cut = content.index(b'class="op-item-row-wrapper not-futures', first + 1)
+        parser = scraper.StreamingPageParser('nhl')
+        parser.feed_bytes(content[:cut + 100])
+        self.assertEqual(len(parser.extractor.rows), 1)
+
+
+class TestAttributeDecoding(unittest.TestCase):
+    def test_every_json_backend_matches_original_scrape(self):
+        content = load_page('nfl')
+        baseline = scrape_page_by_container('nfl', content)
+        for backend in scraper.available_json_backends():
+            with self.subTest(backend=backend), mock.patch.object(
+                    scraper, 'decode_attribute', scraper.make_attribute_decoder(backend)):
+                page = scraper.parse_html(content)
+                self.assertEqual(scraper.scrape_page('nfl', page, scraper.SELECTORS),
+                                 baseline)
+
+    def test_memoized_values_are_not_shared_between_matchups(self):
+        page = scraper.parse_html(load_page('nba'))
+        _, rows = scraper.scrape_page('nba', page, scraper.SELECTORS)
+        rows[0][0]["team_1"]["odds"] = {}
+        _, rows = scraper.scrape_page('nba', page, scraper.SELECTORS)
+        self.assertNotIn("odds", rows[0][0]["team_1"])
+
+
+class TestScanParser(unittest.TestCase):
+    def test_attribute_order_and_quoting_do_not_matter(self):
+        content = load_page('nhl')
+        expected = scrape_page_by_container('nhl', content)
+        # Team divs with data-op-name first, class single quoted and a '>'
+        # inside an attribute value.
+        content = re.sub(
+            rb'<div class="(op-matchup-team [^"]*)" data-op-name="([^"]*)">',
+            rb"""<div data-x='a > b' data-op-name="\2" class='\1'>""", content)
+        page = scraper.parse_html(content, 'scan')
+        self.assertEqual(scraper.scrape_page('nhl', page, scraper.SELECTORS), expected)
+
+    def test_unterminated_tag_is_scanned_in_linear_time(self):
+        content = load_page('nba')
+        # Cut off inside a moneyline value, a tag that never ends, and many
+        # tags whose quoted values never close.
+        cut = content.index(b'data-op-moneyline', len(content) // 2) + 30
+        for truncated in [content[:cut], b'<div class="op-x" ' + b'a' * 100000,
+                          b'<div class="op-a" a="' * 8000]:
+            start = time.perf_counter()
+            scraper.parse_html(truncated, 'scan')
+            self.assertLess(time.perf_counter() - start, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+import os
+import unittest
+from unittest import mock
+import pipeline
+from deadline import Deadline, DeadlineExceeded
+
+PAGES_DIR = os.path.join(os.path.dirname(__file__), 'pages')
+
+
+class FakeResponse:
+    def __init__(self, content=b'', status_code=200, headers=None):
+        self.content = content
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.closed = False
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def page_response(sport, headers=None):
+    with open(os.path.join(PAGES_DIR, f'{sport}.html'), 'rb') as page_file:
+        return FakeResponse(page_file.read(), headers=headers)
+
+
+class TestPipeline(unittest.TestCase):
+    def test_run_enriches_every_matchup_and_times_every_stage(self):
+        stages = []
+        hook = lambda sport, stage, seconds: stages.append((sport, stage))
+        pipeline.add_stage_hook(hook)
+        try:
+            with mock.patch('http_client.fetch', return_value=page_response('nhl')):
+                matchups = pipeline.run('nhl')
+        finally:
+            pipeline.remove_stage_hook(hook)
+
+        self.assertEqual(stages, [('nhl', stage) for stage in pipeline.STAGES])
+        self.assertEqual(len(matchups), 13)
+        for matchup in matchups:
+            for team in ["team_1", "team_2"]:
+                self.assertIn("odds", matchup[team])
+                self.assertIn("money_multiplier", matchup[team])
+                self.assertIn("win_probability", matchup[team])
+
+    def test_not_modified_page_skips_parsing(self):
+        first = page_response('boxing', headers={'ETag': '"boxing-1"'})
+        with mock.patch('http_client.fetch', return_value=first):
+            matchups = pipeline.run('boxing')
+
+        timings = pipeline.StageTimings()
+        pipeline.add_stage_hook(timings.record)
+        try:
+            with mock.patch('http_client.fetch', return_value=FakeResponse(status_code=304)):
+                self.assertIs(pipeline.run('boxing'), matchups)
+        finally:
+            pipeline.remove_stage_hook(timings.record)
+
+        counts = {stage: timing["count"] for stage, timing in timings.snapshot().items()}
+        self.assertEqual(counts, {"fetch": 1, "parse": 0, "weave": 0, "enrich": 0})
+
+    def test_blown_deadline_skips_parsing_and_is_counted(self):
+        def slow_fetch(url, conditional, deadline, **kwargs):
+            deadline.expires_at = 0
+            return page_response('nfl')
+
+        timings = pipeline.StageTimings()
+        pipeline.add_stage_hook(timings.record)
+        misses = pipeline.deadline_misses().get('nfl', 0)
+        try:
+            with mock.patch('http_client.fetch', side_effect=slow_fetch):
+                with self.assertRaises(DeadlineExceeded):
+                    pipeline.run('nfl', Deadline(60))
+        finally:
+            pipeline.remove_stage_hook(timings.record)
+
+        self.assertEqual(timings.snapshot()["parse"]["count"], 0)
+        self.assertEqual(pipeline.deadline_misses()['nfl'], misses + 1)
+
+    def test_streamed_page_gives_same_matchups_and_is_closed(self):
+        with mock.patch('http_client.fetch', return_value=page_response('nba')):
+            expected = pipeline.run('nba')
+
+        response = page_response('nba')
+        with mock.patch.object(pipeline, 'STREAM_PARSE', True), \
+                mock.patch.object(pipeline, 'STREAM_CHUNK_SIZE', 1000), \
+                mock.patch('http_client.fetch', return_value=response) as fetch:
+            self.assertEqual(pipeline.run('nba'), expected)
+        self.assertTrue(fetch.call_args.kwargs['stream'])
+        self.assertTrue(response.closed)
+
+
+class TestParseProcesses(unittest.TestCase):
+    def tearDown(self):
+        pipeline.shutdown_parse_pool()
+
+    def test_worker_processes_give_same_matchups_and_timings(self):
+        with mock.patch('http_client.fetch', return_value=page_response('ufc')):
+            expected = pipeline.run('ufc')
+
+        timings = pipeline.StageTimings()
+        pipeline.add_stage_hook(timings.record)
+        try:
+            with mock.patch.object(pipeline, 'PARSE_PROCESSES', 2), \
+                    mock.patch('http_client.fetch', return_value=page_response('ufc')):
+                matchups = pipeline.run('ufc', Deadline(60))
+        finally:
+            pipeline.remove_stage_hook(timings.record)
+
+        self.assertEqual(matchups, expected)
+        counts = {stage: timing["count"] for stage, timing in timings.snapshot().items()}
+        self.assertEqual(counts, {stage: 1 for stage in pipeline.STAGES})
+
+
+if __name__ == '__main__':
+    unittest.main()
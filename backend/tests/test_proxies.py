@@ -0,0 +1,54 @@
+import unittest
+from proxies import ProxyPool
+
+FAST = "http://10.0.0.1:3128"
+SLOW = "http://10.0.0.2:3128"
+
+
+class TestProxyPool(unittest.TestCase):
+    def test_prefers_untried_then_fastest_proxy(self):
+        pool = ProxyPool([SLOW, FAST])
+        pool.record_success(SLOW, 2.0)
+        self.assertEqual(pool.choose(), FAST)
+
+        pool.record_success(FAST, 0.2)
+        self.assertEqual(pool.choose(), FAST)
+        self.assertEqual(pool.choose(exclude=[FAST]), SLOW)
+        self.assertIsNone(pool.choose(exclude=[FAST, SLOW]))
+
+    def test_failing_proxy_is_ejected(self):
+        pool = ProxyPool([FAST, SLOW], cooldown=60)
+        pool.record_success(SLOW, 2.0)
+        for _ in range(4):
+            pool.record_failure(FAST)
+
+        self.assertTrue(pool.stats()[FAST]["ejected"])
+        self.assertEqual(pool.choose(), SLOW)
+
+    def test_ejected_proxy_is_reprobed_after_cooldown(self):
+        pool = ProxyPool([FAST, SLOW], cooldown=0)
+        pool.record_success(SLOW, 2.0)
+        for _ in range(4):
+            pool.record_failure(FAST)
+
+        # The probe is handed out once; until it answers, traffic stays on SLOW.
+        self.assertEqual(pool.choose(), FAST)
+        self.assertEqual(pool.choose(), SLOW)
+
+        pool.record_success(FAST, 0.1)
+        self.assertFalse(pool.stats()[FAST]["ejected"])
+        self.assertEqual(pool.choose(), FAST)
+
+    def test_released_probe_is_handed_out_again(self):
+        pool = ProxyPool([FAST, SLOW], cooldown=0)
+        pool.record_success(SLOW, 2.0)
+        for _ in range(4):
+            pool.record_failure(FAST)
+
+        self.assertEqual(pool.choose(), FAST)
+        pool.release(FAST)
+        self.assertEqual(pool.choose(), FAST)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import time
+import unittest
+from ratelimit import RateLimiter, TokenBucket
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_refills_at_rate_up_to_capacity(self):
+        bucket = TokenBucket(rate=10, capacity=2)
+        now = time.monotonic()
+        for _ in range(2):
+            self.assertEqual(bucket.wait_time(now), 0)
+            bucket.take()
+        self.assertAlmostEqual(bucket.wait_time(now), 0.1, places=2)
+        self.assertEqual(bucket.wait_time(now + 0.11), 0)
+        bucket.wait_time(now + 60)
+        self.assertEqual(bucket.tokens, 2)
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_rejects_once_burst_is_spent(self):
+        limiter = RateLimiter(rate=1, burst=2, key_rate=0, key_burst=0)
+        self.assertTrue(limiter.acquire("oddsshark.com", 0))
+        self.assertTrue(limiter.acquire("example.com", 0))
+        self.assertFalse(limiter.acquire("oddsshark.com", 0))
+        self.assertEqual(limiter.stats(), {"admitted": 2, "delayed": 0, "rejected": 1})
+
+    def test_each_key_has_its_own_bucket(self):
+        limiter = RateLimiter(rate=0, burst=0, key_rate=1, key_burst=1)
+        self.assertTrue(limiter.acquire("oddsshark.com", 0))
+        self.assertFalse(limiter.acquire("oddsshark.com", 0))
+        self.assertTrue(limiter.acquire("example.com", 0))
+
+    def test_waits_for_a_token_within_timeout(self):
+        limiter = RateLimiter(rate=20, burst=1, key_rate=20, key_burst=1)
+        limiter.acquire("oddsshark.com", 0)
+        start = time.monotonic()
+        self.assertTrue(limiter.acquire("oddsshark.com", 1))
+        self.assertGreaterEqual(time.monotonic() - start, 0.03)
+        self.assertEqual(limiter.stats()["delayed"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
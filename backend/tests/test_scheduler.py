@@ -0,0 +1,76 @@
+import threading
+import unittest
+from datetime import datetime
+from scheduler import RefreshScheduler
+
+
+class TestRefreshScheduler(unittest.TestCase):
+    def make_scheduler(self, refresh, **kwargs):
+        options = dict(interval=60, game_interval=10, game_window=3600)
+        options.update(kwargs)
+        return RefreshScheduler(["nba", "nhl"], refresh, **options)
+
+    def test_interval_tightens_near_game_start(self):
+        scheduler = self.make_scheduler(lambda sport: [])
+        now = datetime(2022, 1, 9, 19, 0)
+        soon = [{"datetime": "2022-01-09 19:30:00"}]
+        later = [{"datetime": "2022-01-10 19:30:00"}]
+
+        self.assertEqual(scheduler.interval_for(soon, now), 10)
+        self.assertEqual(scheduler.interval_for(later, now), 60)
+        self.assertEqual(scheduler.interval_for([], now), 60)
+
+    def test_every_sport_is_refreshed_on_its_own_cadence(self):
+        calls = []
+        both_refreshed_twice = threading.Event()
+
+        def refresh(sport):
+            calls.append(sport)
+            if calls.count("nba") >= 2 and calls.count("nhl") >= 2:
+                both_refreshed_twice.set()
+            if sport == "nhl":
+                raise RuntimeError("proxy down")
+            return []
+
+        scheduler = self.make_scheduler(refresh, interval=0.05)
+        scheduler.start()
+        try:
+            self.assertTrue(scheduler.running())
+            self.assertTrue(both_refreshed_twice.wait(5))
+        finally:
+            scheduler.stop(5)
+        self.assertFalse(scheduler.running())
+        self.assertEqual(scheduler.intervals(), {"nba": 0.05, "nhl": 0.05})
+
+    def test_interval_adapts_to_line_movement(self):
+        def matchups(odd):
+            team = lambda name: {"full_name": name, "odds": {"opening": odd}}
+            return [{"datetime": "2000-01-01 00:00:00",
+                     "team_1": team("Boston"), "team_2": team("Miami")}]
+
+        counter = iter(range(10 ** 6))
+        enough_refreshes = threading.Event()
+
+        def refresh(sport):
+            if min(s["refreshes"] for s in scheduler.stats().values()) >= 6:
+                enough_refreshes.set()
+            # NBA lines move on every refresh, NHL lines never do.
+            return matchups(next(counter) if sport == "nba" else -110)
+
+        scheduler = self.make_scheduler(refresh, interval=0.02, min_interval=0.01,
+                                        max_interval=0.04)
+        scheduler.start()
+        try:
+            self.assertTrue(enough_refreshes.wait(5))
+        finally:
+            scheduler.stop(5)
+
+        stats = scheduler.stats()
+        self.assertEqual(stats["nba"]["interval"], 0.01)
+        self.assertEqual(stats["nhl"]["interval"], 0.04)
+        self.assertEqual(stats["nhl"]["odds_changes"], 0)
+        self.assertEqual(stats["nba"]["odds_changes"], stats["nba"]["refreshes"] - 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
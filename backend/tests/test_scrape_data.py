@@ -1,4 +1,6 @@
+import json
 import unittest
+from datetime import date
 import scrape_data as scraper
 import requests
 from bs4 import BeautifulSoup
@@ -70,5 +72,29 @@ class TestWebScraping(unittest.TestCase):
         )
     
 
+class TestGameDates(unittest.TestCase):
+    @staticmethod
+    def date_json(full_date):
+        return json.dumps({"full_date": full_date, "short_date": ""})
+
+    def test_year_rolls_over_at_new_year(self):
+        december = date(2021, 12, 30)
+        january = date(2022, 1, 2)
+        self.assertEqual(scraper.parse_game_date(self.date_json("Saturday January 8"), december),
+                         (2022, 1, 8))
+        self.assertEqual(scraper.parse_game_date(self.date_json("Thursday December 30"), january),
+                         (2021, 12, 30))
+        self.assertEqual(scraper.parse_game_date(self.date_json("Monday March 14"), january),
+                         (2022, 3, 14))
+
+    def test_leap_day_goes_to_the_nearest_leap_year(self):
+        self.assertEqual(scraper.parse_game_date(self.date_json("Thursday February 29"),
+                                                 date(2023, 12, 1)), (2024, 2, 29))
+
+    def test_game_datetime(self):
+        self.assertEqual(scraper.game_datetime((2022, 1, 8), "12:05p"), "2022-01-08 12:05:00")
+        self.assertEqual(scraper.game_datetime((2022, 1, 8), "7:30p"), "2022-01-08 19:30:00")
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,119 @@
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+import requests
+import server
+from concurrent.futures import ThreadPoolExecutor
+from snapshots import SnapshotStore
+
+
+def fake_scrape(sport):
+    return [{"sport": sport}]
+
+
+class TestOddsEndpoints(unittest.TestCase):
+    def setUp(self):
+        server.odds_cache.clear()
+        self.client = server.app.test_client()
+
+    @mock.patch.object(server, "scrape_odds_for", side_effect=fake_scrape)
+    def test_single_sport_reports_cache_status(self, _):
+        response = self.client.get("/api/odds/nba")
+        self.assertEqual(response.json, [{"sport": "nba"}])
+        self.assertEqual(response.headers["X-Cache"], "MISS")
+
+        response = self.client.get("/api/odds/nba")
+        self.assertEqual(response.headers["X-Cache"], "HIT")
+
+    @mock.patch.object(server, "scrape_odds_for", side_effect=fake_scrape)
+    def test_bulk_combines_requested_sports_in_order(self, _):
+        response = self.client.get("/api/odds?sports=nhl,nba")
+        self.assertEqual(response.json, [{"sport": "nhl"}, {"sport": "nba"}])
+        self.assertEqual(response.headers["X-Cache"], "nhl=MISS, nba=MISS")
+
+    @mock.patch.object(server, "scrape_odds_for", side_effect=fake_scrape)
+    def test_bulk_defaults_to_every_sport(self, scrape):
+        response = self.client.get("/api/odds")
+        self.assertEqual(sorted(m["sport"] for m in response.json),
+                         sorted(server.scraper.SPORTS))
+        self.assertEqual(scrape.call_count, len(server.scraper.SPORTS))
+
+    @mock.patch.object(server, "scrape_odds_for", side_effect=fake_scrape)
+    def test_bulk_answers_cached_sports_without_waiting_on_scrapes(self, _):
+        release = threading.Event()
+        busy_executor = ThreadPoolExecutor(max_workers=1)
+        busy_executor.submit(release.wait, 5)
+        self.addCleanup(busy_executor.shutdown)
+        self.addCleanup(release.set)
+        for sport in server.scraper.SPORTS:
+            server.odds_cache.put(sport, fake_scrape(sport))
+
+        with mock.patch.object(server, "scrape_executor", busy_executor):
+            start = time.monotonic()
+            response = self.client.get("/api/odds?sports=nhl,nba")
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual(response.headers["X-Cache"], "nhl=HIT, nba=HIT")
+
+    @mock.patch.object(server, "scrape_odds_for", side_effect=fake_scrape)
+    def test_scheduler_interval_sets_freshness(self, scrape):
+        server.odds_cache.put("boxing", [{"sport": "old"}], age=120)
+        with mock.patch.object(server.refresh_scheduler, "running", return_value=True), \
+                mock.patch.object(server.refresh_scheduler, "intervals",
+                                  return_value={"boxing": 300}):
+            response = self.client.get("/api/odds/boxing")
+        self.assertEqual(response.headers["X-Cache"], "HIT")
+        scrape.assert_not_called()
+
+    def test_bulk_rejects_unknown_sport(self):
+        response = self.client.get("/api/odds?sports=nba,foosball")
+        self.assertEqual(response.status_code, 404)
+
+
+class TestFallback(unittest.TestCase):
+    def setUp(self):
+        server.odds_cache.clear()
+        self.client = server.app.test_client()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = SnapshotStore(self.temp_dir.name)
+        patcher = mock.patch.object(server, "snapshot_store", self.store)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def test_successful_scrape_is_saved(self):
+        with mock.patch("pipeline.run", return_value=[{"sport": "nhl"}]):
+            self.client.get("/api/odds/nhl")
+        self.assertEqual(self.store.get("nhl"), [{"sport": "nhl"}])
+
+    @mock.patch("pipeline.run", side_effect=requests.exceptions.ProxyError())
+    def test_proxy_error_serves_latest_snapshot(self, _):
+        self.store.save("ncaab", [{"sport": "ncaab"}])
+        response = self.client.get("/api/odds/ncaab")
+        self.assertEqual(response.status_code, 203)
+        self.assertEqual(response.json, [{"sport": "ncaab"}])
+
+    @mock.patch("pipeline.run", side_effect=server.http_client.RateLimited())
+    def test_rate_limited_scrape_serves_latest_snapshot(self, _):
+        self.store.save("nfl", [{"sport": "nfl"}])
+        response = self.client.get("/api/odds/nfl")
+        self.assertEqual(response.status_code, 203)
+        self.assertEqual(response.json, [{"sport": "nfl"}])
+
+    @mock.patch("pipeline.run", side_effect=requests.exceptions.ProxyError())
+    def test_proxy_error_without_snapshot_serves_placeholder(self, _):
+        for sport in ["ncaab", "nba"]:
+            response = self.client.get(f"/api/odds/{sport}")
+            self.assertEqual(response.status_code, 203)
+            self.assertEqual(response.json, server.bc.get_fake_data(sport))
+
+    @mock.patch("pipeline.run", side_effect=requests.exceptions.ProxyError())
+    def test_proxy_error_without_any_fallback_serves_empty_list(self, _):
+        with mock.patch.object(server.bc, "get_fake_data", side_effect=KeyError("nhl")):
+            response = self.client.get("/api/odds/nhl")
+        self.assertEqual((response.status_code, response.json), (203, []))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import threading
+import time
+import unittest
+from singleflight import SingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+    def test_concurrent_callers_share_one_call(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def scrape(sport):
+            calls.append(sport)
+            release.wait(5)
+            return [sport]
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(flight.do("nba", scrape, "nba")))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        # Give every thread time to join the in-flight call.
+        time.sleep(0.2)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(calls, ["nba"])
+        self.assertEqual(results, [["nba"]] * 5)
+        self.assertFalse(flight.in_flight("nba"))
+
+    def test_error_is_raised_and_key_released(self):
+        flight = SingleFlight()
+
+        def scrape():
+            raise ValueError("proxy down")
+
+        with self.assertRaises(ValueError):
+            flight.do("nhl", scrape)
+        self.assertEqual(flight.do("nhl", lambda: "ok"), "ok")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+import os
+import tempfile
+import unittest
+from snapshots import SnapshotStore
+
+
+class TestSnapshotStore(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.temp_dir.name, 'snapshots')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_save_then_get_from_memory(self):
+        store = SnapshotStore(self.directory)
+        self.assertIsNone(store.get("nba"))
+        store.save("nba", [{"sport": "nba"}])
+        self.assertEqual(store.get("nba"), [{"sport": "nba"}])
+        self.assertLess(store.age("nba"), 5)
+        self.assertEqual(os.listdir(self.directory), ["nba.json"])
+
+    def test_cold_start_loads_from_disk(self):
+        SnapshotStore(self.directory).save("ncaab", [{"sport": "ncaab"}])
+
+        store = SnapshotStore(self.directory)
+        self.assertEqual(store.load(["ncaab", "nhl"]), ["ncaab"])
+        self.assertEqual(store.get("ncaab"), [{"sport": "ncaab"}])
+        self.assertIsNone(store.get("nhl"))
+
+
+if __name__ == '__main__':
+    unittest.main()
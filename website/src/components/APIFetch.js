@@ -8,19 +8,11 @@ const APIFetch = ({ availableSports }) => {
 	const [isFetching, setIsFetching] = useState(true);
 
 	const fetchAllMatchups = async () => {
-		const httpRequests = [];
-		availableSports.forEach((sport) => {
-			httpRequests.push(axios(`http://127.0.0.1:5000/api/odds/${sport}`));
-			console.log("sending request");
-		});
-		const response = await Promise.all(httpRequests);
-		const allMatchups = [];
-		response.forEach((sport) => {
-			sport.data.forEach((match) => {
-				allMatchups.push(match);
-			});
-		});
-		return allMatchups;
+		const sports = availableSports.join(",");
+		const response = await axios(
+			`http://127.0.0.1:5000/api/odds?sports=${sports}`
+		);
+		return response.data;
 	};
 
 	useEffect(() => {
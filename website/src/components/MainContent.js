@@ -19,18 +19,11 @@ const MainContent = ({ availableSports }) => {
 
 	// Fetch matchups from API for all available sports and return in array.
 	const fetchAllMatchups = async () => {
-		const httpRequests = [];
-		availableSports.forEach((sport) => {
-			httpRequests.push(axios(`http://127.0.0.1:5000/api/odds/${sport}`));
-		});
-		const response = await Promise.all(httpRequests);
-		const allMatchups = [];
-		response.forEach((sport) => {
-			sport.data.forEach((match) => {
-				allMatchups.push(match);
-			});
-		});
-		return allMatchups;
+		const sports = availableSports.join(",");
+		const response = await axios(
+			`http://127.0.0.1:5000/api/odds?sports=${sports}`
+		);
+		return response.data;
 	};
 
 	// On first render, fetch all odds, add to session, and set in state.